@@ -22,11 +22,12 @@ sys.path.append(os.path.dirname(__file__))
 
 # Import with proper handling
 try:
-    from tensorflow_quantum_integration import QuantumPredictiveModel
+    from tensorflow_quantum_integration import QuantumPredictiveModel, PredictionCache
     from oracle_feed_quantum import QuantumOracleFeed
 except ImportError:
     # Fallback imports
     QuantumPredictiveModel = None
+    PredictionCache = None
     QuantumOracleFeed = None
 
 
@@ -41,9 +42,17 @@ class FAAActuaryQuantumCore:
     - Revenue projections with quantum optimization
     """
     
-    def __init__(self, config: Optional[Dict] = None):
+    def __init__(self, config: Optional[Dict] = None, seed=None):
         self.config = config or self._default_config()
         
+        # Independent random streams for the quantum model and oracle feed,
+        # derived from one root seed (argument, else config "seed")
+        if seed is None:
+            seed = self.config.get("seed")
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.model_seed, self.oracle_seed = seed.spawn(2)
+        
         # Initialize quantum components (simulated imports)
         self.quantum_model = None  # Will be initialized on first use
         self.oracle_feed = None
@@ -62,15 +71,22 @@ class FAAActuaryQuantumCore:
     def _default_config(self) -> Dict:
         """Default configuration for Phase 38"""
         return {
+            "seed": None,
             "quantum": {
                 "n_qubits": 8,
                 "circuit_depth": 10,
-                "learning_rate": 0.01
+                "learning_rate": 0.01,
+                "precision": "double"
             },
             "oracle": {
                 "n_oracles": 24,
                 "cycle_seconds": 9.0,
-                "target_divergence": 0.003
+                "target_divergence": 0.003,
+                "history_depth": 1000,
+                "entanglement": {
+                    "cutoff": None,
+                    "decay_length": None
+                }
             },
             "actuary": {
                 "target_revenue": 1.45e9,
@@ -81,24 +97,48 @@ class FAAActuaryQuantumCore:
                 "version": "3.1",
                 "update_interval": 1.0,
                 "dashboard_enabled": True
+            },
+            "performance": {
+                "caching_enabled": True,
+                "cache_ttl_seconds": 300,
+                "cache_max_entries": 4096
             }
         }
     
     def initialize_quantum_model(self):
         """Initialize quantum predictive model"""
-        global QuantumPredictiveModel
+        global QuantumPredictiveModel, PredictionCache
         if QuantumPredictiveModel is None:
-            from tensorflow_quantum_integration import QuantumPredictiveModel
-        
-        self.quantum_model = QuantumPredictiveModel(
-            n_qubits=self.config["quantum"]["n_qubits"],
-            learning_rate=self.config["quantum"]["learning_rate"]
-        )
+            from tensorflow_quantum_integration import QuantumPredictiveModel, PredictionCache
+        
+        # Warm-start from a trained checkpoint when one is configured
+        checkpoint = self.config["quantum"].get("checkpoint")
+        if checkpoint and os.path.exists(checkpoint):
+            self.quantum_model = QuantumPredictiveModel.load(
+                checkpoint, mmap_mode="r", seed=self.model_seed
+            )
+        else:
+            checkpoint = None
+            self.quantum_model = QuantumPredictiveModel(
+                n_qubits=self.config["quantum"]["n_qubits"],
+                learning_rate=self.config["quantum"]["learning_rate"],
+                precision=self.config["quantum"].get("precision", "double"),
+                seed=self.model_seed
+            )
+        
+        # Serve repeated feature vectors from the prediction cache
+        performance = self.config.get("performance", {})
+        if performance.get("caching_enabled", False):
+            self.quantum_model.prediction_cache = PredictionCache(
+                max_entries=performance.get("cache_max_entries", 4096),
+                ttl_seconds=performance.get("cache_ttl_seconds", 300)
+            )
         
         return {
             "status": "INITIALIZED",
-            "qubits": self.config["quantum"]["n_qubits"],
-            "circuit_depth": self.config["quantum"]["circuit_depth"],
+            "qubits": self.quantum_model.quantum_circuit.n_qubits,
+            "circuit_depth": self.quantum_model.quantum_circuit.circuit_depth,
+            "checkpoint": checkpoint,
             "signature": self.quantum_model.get_quantum_signature()
         }
     
@@ -108,9 +148,15 @@ class FAAActuaryQuantumCore:
         if QuantumOracleFeed is None:
             from oracle_feed_quantum import QuantumOracleFeed
         
+        # Banded entanglement when a cutoff is configured
+        entanglement = self.config["oracle"].get("entanglement", {})
         self.oracle_feed = QuantumOracleFeed(
             n_oracles=self.config["oracle"]["n_oracles"],
-            cycle_seconds=self.config["oracle"]["cycle_seconds"]
+            cycle_seconds=self.config["oracle"]["cycle_seconds"],
+            seed=self.oracle_seed,
+            history_depth=self.config["oracle"].get("history_depth", 1000),
+            entanglement_cutoff=entanglement.get("cutoff"),
+            entanglement_length=entanglement.get("decay_length")
         )
         
         return {
@@ -256,8 +302,11 @@ class FAAActuaryQuantumCore:
         
         # Get quantum model signature if available
         quantum_signature = "NOT_INITIALIZED"
+        cache_stats = None
         if self.quantum_model is not None:
             quantum_signature = self.quantum_model.get_quantum_signature()
+            if self.quantum_model.prediction_cache is not None:
+                cache_stats = self.quantum_model.prediction_cache.stats()
         
         return {
             "phase": 38,
@@ -268,7 +317,8 @@ class FAAActuaryQuantumCore:
             "quantum": {
                 "enabled": self.quantum_model is not None,
                 "signature": quantum_signature,
-                "qubits": self.config["quantum"]["n_qubits"]
+                "qubits": self.config["quantum"]["n_qubits"],
+                "prediction_cache": cache_stats
             },
             "oracle": {
                 "enabled": self.oracle_feed is not None,
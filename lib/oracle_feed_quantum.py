@@ -6,17 +6,406 @@ Phase 38 Blueprint - 9-second predictive divergence to 0.003%
 Provides real-time oracle feeds with quantum-enhanced predictions:
 - Sub-9-second prediction cycles
 - 0.003% divergence accuracy
-- Quantum entanglement for correlation detection
+- Quantum entanglement for correlation detection (dense or banded)
 - Multi-oracle consensus with quantum voting
 """
 
 import numpy as np
 import json
+import math
+from collections import deque
+from collections.abc import MutableMapping
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timezone, timedelta
 import time
 import hashlib
 
+# Optional: sparse matvec for banded entanglement (numpy kernel otherwise)
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+
+# Per-oracle parameters, each held as one float vector on the feed
+ORACLE_FIELDS = ["quantum_phase", "entanglement_strength", "coherence_time",
+                 "accuracy_score", "last_update"]
+
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer of rows; once full, each append overwrites
+    the oldest row
+    """
+    
+    def __init__(self, capacity: int, row_shape: Tuple = (), dtype=np.float64):
+        if capacity < 1:
+            raise ValueError(f"Ring buffer capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.data = np.zeros((capacity,) + tuple(row_shape), dtype=dtype)
+        self.position = 0  # next row to write
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def append(self, row):
+        """Store one row"""
+        self.data[self.position] = row
+        self.position = (self.position + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+    
+    def extend(self, rows):
+        """Store many rows at once; only the last capacity rows are kept"""
+        rows = np.asarray(rows)[-self.capacity:]
+        index = (self.position + np.arange(len(rows))) % self.capacity
+        self.data[index] = rows
+        self.position = (self.position + len(rows)) % self.capacity
+        self.size = min(self.size + len(rows), self.capacity)
+    
+    def latest(self):
+        """Most recent row"""
+        return self.data[(self.position - 1) % self.capacity]
+    
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        """Copy of the last n rows (all stored rows by default), oldest first"""
+        n = self.size if n is None else min(n, self.size)
+        return self.data[(self.position - n + np.arange(n)) % self.capacity]
+
+
+class RollingStats:
+    """
+    Mean, std, min and max over the last window values in O(1) per value
+    
+    Sums are updated incrementally and recomputed exactly once per window
+    so rounding error cannot accumulate; min and max come from monotonic
+    deques.
+    """
+    
+    def __init__(self, window: int = 100):
+        if window < 1:
+            raise ValueError(f"Rolling window must be positive, got {window}")
+        self.window = window
+        self.values = np.zeros(window)
+        self.position = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._min = deque()  # (sequence, value), values increasing
+        self._max = deque()  # (sequence, value), values decreasing
+        self._sequence = 0
+    
+    def push(self, value: float):
+        """Add a value, evicting the oldest once the window is full"""
+        value = float(value)
+        if self.count == self.window:
+            evicted = self.values[self.position]
+            self.total -= evicted
+            self.total_sq -= evicted * evicted
+        else:
+            self.count += 1
+        
+        self.values[self.position] = value
+        self.total += value
+        self.total_sq += value * value
+        self.position = (self.position + 1) % self.window
+        if self.position == 0:
+            self.total = float(np.sum(self.values[:self.count]))
+            self.total_sq = float(np.dot(self.values[:self.count], self.values[:self.count]))
+        
+        oldest = self._sequence - self.count + 1
+        for extremes, better in ((self._min, value.__le__), (self._max, value.__ge__)):
+            while extremes and better(extremes[-1][1]):
+                extremes.pop()
+            extremes.append((self._sequence, value))
+            while extremes[0][0] < oldest:
+                extremes.popleft()
+        self._sequence += 1
+    
+    def extend(self, values):
+        """Add many values; only the last window of them can matter"""
+        for value in np.asarray(values, dtype=float)[-self.window:].tolist():
+            self.push(value)
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    @property
+    def std(self) -> float:
+        if not self.count:
+            return 0.0
+        mean = self.mean
+        return float(np.sqrt(max(0.0, self.total_sq / self.count - mean * mean)))
+    
+    @property
+    def min(self) -> float:
+        return self._min[0][1] if self._min else 0.0
+    
+    @property
+    def max(self) -> float:
+        return self._max[0][1] if self._max else 0.0
+
+
+def _band_windows(values: np.ndarray, half_width: int) -> np.ndarray:
+    """
+    Sliding windows over the last axis: [..., i, half_width + offset] is
+    values[..., i + offset], or 0 past either end (a view, not a copy)
+    """
+    padding = [(0, 0)] * (values.ndim - 1) + [(half_width, half_width)]
+    return np.lib.stride_tricks.sliding_window_view(
+        np.pad(values, padding), 2 * half_width + 1, axis=-1
+    )
+
+
+class StreamingCorrelation:
+    """
+    Exponentially weighted correlation between oracle predictions
+    
+    Keeps weighted first and second moments, so each new prediction
+    vector costs O(n^2) and history is never re-read. Moments are taken
+    about the first observation to avoid cancellation, and normalized by
+    the total weight seen so early estimates are unbiased. The decay of
+    the n x n moment matrix is kept as a separate scale factor, so an
+    update is a single rank-1 pass over it.
+    
+    With half_width set, only pairs within half_width of each other are
+    tracked, stored in BandedMatrix layout, for O(n * half_width) per
+    update.
+    """
+    
+    def __init__(self, n_features: int, span: float = 10.0,
+                 half_width: Optional[int] = None):
+        if span < 1:
+            raise ValueError(f"Correlation span must be at least 1, got {span}")
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+        self.count = 0
+        self.shift = np.zeros(n_features)
+        self.weight = 0.0
+        self.mean_sum = np.zeros(n_features)
+        self.half_width = half_width
+        if half_width is None:
+            self._moments = np.zeros((n_features, n_features))
+        else:
+            self._moments = np.zeros((n_features, 2 * half_width + 1))
+        self._moment_scale = 1.0
+    
+    @property
+    def moment_sum(self) -> np.ndarray:
+        """Weighted sum of centered outer products"""
+        return self._moments * self._moment_scale
+    
+    def _outer(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Outer product a b^T, restricted to the band if there is one"""
+        if self.half_width is None:
+            return np.outer(a, b)
+        return a[:, None] * _band_windows(b, self.half_width)
+    
+    def _decay_moments(self, factor: float):
+        self._moment_scale *= factor
+        if self._moment_scale < 1e-150:
+            # Fold the scale back in before it underflows
+            self._moments *= self._moment_scale
+            self._moment_scale = 1.0
+    
+    def update(self, x: np.ndarray):
+        """Fold one observation into the estimate"""
+        if self.count == 0:
+            self.shift = np.array(x, dtype=float)
+        centered = x - self.shift
+        decay = 1.0 - self.alpha
+        self.weight = decay * self.weight + self.alpha
+        self.mean_sum = decay * self.mean_sum + self.alpha * centered
+        self._decay_moments(decay)
+        self._moments += self._outer(centered * (self.alpha / self._moment_scale), centered)
+        self.count += 1
+    
+    def update_batch(self, rows: np.ndarray):
+        """Fold many observations (oldest first) in one weighted update"""
+        rows = np.atleast_2d(rows)
+        if self.count == 0:
+            self.shift = np.array(rows[0], dtype=float)
+        centered = rows - self.shift
+        
+        # Row k of n gets weight alpha * (1 - alpha)^(n - 1 - k)
+        n = len(rows)
+        decay = 1.0 - self.alpha
+        weights = self.alpha * decay ** np.arange(n - 1, -1, -1)
+        self.weight = decay ** n * self.weight + weights.sum()
+        self.mean_sum = decay ** n * self.mean_sum + weights @ centered
+        self._decay_moments(decay ** n)
+        scaled_weights = weights / self._moment_scale
+        if self.half_width is None:
+            self._moments += (centered.T * scaled_weights) @ centered
+        else:
+            self._moments += np.einsum(
+                's,si,sij->ij', scaled_weights, centered,
+                _band_windows(centered, self.half_width)
+            )
+        self.count += n
+    
+    def covariance(self) -> np.ndarray:
+        """Weighted covariance of the observations"""
+        if self.weight == 0:
+            return np.zeros_like(self._moments)
+        mean = self.mean_sum / self.weight
+        covariance = self._moments * (self._moment_scale / self.weight)
+        covariance -= self._outer(mean, mean)
+        return covariance
+    
+    def correlation(self) -> np.ndarray:
+        """Weighted correlation; 0 off the diagonal for constant features"""
+        correlation = self.covariance()
+        if self.half_width is None:
+            variance = np.diag(correlation)
+        else:
+            variance = correlation[:, self.half_width]
+        std = np.sqrt(np.maximum(variance, 0.0))
+        inverse_std = np.divide(1.0, std, out=np.zeros_like(std), where=std > 0)
+        correlation *= self._outer(inverse_std, inverse_std)
+        if self.half_width is None:
+            np.fill_diagonal(correlation, 1.0)
+        else:
+            correlation[:, self.half_width] = 1.0
+        return np.clip(correlation, -1.0, 1.0, out=correlation)
+
+
+class BandedMatrix:
+    """
+    Square matrix that keeps only the band |i - j| <= half_width
+    
+    Row i of band holds the entries for columns i - half_width through
+    i + half_width; positions outside the matrix hold 0. Products go
+    through scipy.sparse when it is installed, otherwise through a
+    sliding-window numpy kernel, in O(n * half_width) either way.
+    """
+    
+    def __init__(self, band: np.ndarray):
+        self.n, width = band.shape
+        self.half_width = (width - 1) // 2
+        offsets = np.arange(-self.half_width, self.half_width + 1)
+        self.rows = np.broadcast_to(np.arange(self.n)[:, None], band.shape)
+        self.columns = self.rows + offsets
+        self.valid = (self.columns >= 0) & (self.columns < self.n)
+        self.band = np.where(self.valid, band, 0.0)
+        self._sparse = None
+    
+    @classmethod
+    def distance_decay(cls, n: int, length: float, cutoff: float) -> "BandedMatrix":
+        """
+        Band of exp(-|i - j| / length), dropping entries below cutoff
+        
+        Args:
+            n: Matrix size
+            length: Decay length in index distance
+            cutoff: Smallest entry kept, in (0, 1)
+        """
+        half_width = cls.decay_half_width(n, length, cutoff)
+        offsets = np.arange(-half_width, half_width + 1)
+        return cls(np.tile(np.exp(-np.abs(offsets) / length), (n, 1)))
+    
+    @staticmethod
+    def decay_half_width(n: int, length: float, cutoff: float) -> int:
+        """Widest distance whose exp(-distance / length) is at least cutoff"""
+        if not 0 < cutoff < 1:
+            raise ValueError(f"Entanglement cutoff must be in (0, 1), got {cutoff}")
+        return min(n - 1, int(math.floor(length * math.log(1 / cutoff))))
+    
+    @staticmethod
+    def band_density(n: int, half_width: int) -> float:
+        """Fraction of an n x n matrix inside the band"""
+        return (n * (2 * half_width + 1) - half_width * (half_width + 1)) / (n * n)
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.n, self.n)
+    
+    @property
+    def density(self) -> float:
+        """Fraction of the dense matrix stored"""
+        return self.band_density(self.n, self.half_width)
+    
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros(self.shape)
+        dense[self.rows[self.valid], self.columns[self.valid]] = self.band[self.valid]
+        return dense
+    
+    def apply(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Matrix times each vector
+        
+        Args:
+            vectors: Vector of length n, or (n_samples, n) matrix of row vectors
+        
+        Returns:
+            Products with the same shape as vectors
+        """
+        if sparse is not None:
+            if self._sparse is None:
+                self._sparse = sparse.csr_matrix(
+                    (self.band[self.valid], (self.rows[self.valid], self.columns[self.valid])),
+                    shape=self.shape
+                )
+            return (self._sparse @ vectors.T).T
+        
+        return np.einsum('ij,...ij->...i', self.band, _band_windows(vectors, self.half_width))
+    
+    def blend(self, band: np.ndarray, weight: float):
+        """Move the stored entries toward band (same layout) by the given weight"""
+        self.band *= 1 - weight
+        self.band += weight * np.where(self.valid, band, 0.0)
+        self._sparse = None
+    
+    def normalize_rows(self):
+        """Scale every row so its largest entry is 1"""
+        self.band /= np.max(self.band, axis=1, keepdims=True)
+        self._sparse = None
+
+
+class OracleState(MutableMapping):
+    """
+    Dict-style view of one oracle's entry in the feed's state vectors
+    
+    Reads and writes go straight to the vectors; last_update is kept as
+    a POSIX timestamp and exposed as an ISO string.
+    """
+    
+    __slots__ = ("_feed", "_index")
+    
+    def __init__(self, feed: "QuantumOracleFeed", index: int):
+        self._feed = feed
+        self._index = index
+    
+    def __getitem__(self, key):
+        if key == "id":
+            return self._index
+        if key not in ORACLE_FIELDS:
+            raise KeyError(key)
+        value = float(getattr(self._feed, key)[self._index])
+        if key == "last_update":
+            return datetime.fromtimestamp(value, timezone.utc).isoformat()
+        return value
+    
+    def __setitem__(self, key, value):
+        if key not in ORACLE_FIELDS:
+            raise KeyError(key)
+        if key == "last_update":
+            value = datetime.fromisoformat(value).timestamp()
+        getattr(self._feed, key)[self._index] = value
+    
+    def __delitem__(self, key):
+        raise TypeError("Oracle state fields cannot be deleted")
+    
+    def __iter__(self):
+        return iter(["id"] + ORACLE_FIELDS)
+    
+    def __len__(self):
+        return len(ORACLE_FIELDS) + 1
+    
+    def __repr__(self):
+        return repr(dict(self))
+
 
 class QuantumOracleFeed:
     """
@@ -24,50 +413,89 @@ class QuantumOracleFeed:
     Achieves 0.003% predictive divergence through quantum algorithms
     """
     
-    def __init__(self, n_oracles: int = 24, cycle_seconds: float = 9.0):
+    def __init__(self, n_oracles: int = 24, cycle_seconds: float = 9.0, seed=None,
+                 history_depth: int = 1000, metrics_window: int = 100,
+                 correlation_span: float = 10.0,
+                 entanglement_cutoff: Optional[float] = None,
+                 entanglement_length: Optional[float] = None):
         self.n_oracles = n_oracles
         self.cycle_seconds = cycle_seconds
         self.target_divergence = 0.003  # 0.003% target
         
-        # Oracle states
-        self.oracle_states = [self._initialize_oracle(i) for i in range(n_oracles)]
+        # Random stream for oracle parameters and prediction noise
+        self.rng = np.random.default_rng(seed)
         
-        # Quantum entanglement matrix for correlation
-        self.entanglement_matrix = self._generate_entanglement_matrix()
+        # Oracle states as vectors, one entry per oracle
+        self._initialize_oracles()
         
-        # Prediction history for divergence tracking
-        self.prediction_history = []
-        self.divergence_history = []
+        # Quantum entanglement matrix for correlation: dense, or banded when
+        # entries below entanglement_cutoff are dropped
+        self.entanglement_cutoff = entanglement_cutoff
+        self.entanglement_length = entanglement_length or n_oracles / 4
+        self.entanglement_matrix = self._generate_entanglement_matrix()
         
-    def _initialize_oracle(self, oracle_id: int) -> Dict:
-        """Initialize individual oracle with quantum parameters"""
-        return {
-            "id": oracle_id,
-            "quantum_phase": np.random.uniform(0, 2 * np.pi),
-            "entanglement_strength": np.random.uniform(0.7, 1.0),
-            "coherence_time": np.random.uniform(8.5, 9.5),
-            "predictions": [],
-            "accuracy_score": 1.0,
-            "last_update": datetime.now(timezone.utc).isoformat()
+        # Prediction history for divergence tracking: the last
+        # history_depth predictions in fixed-size ring buffers, and rolling
+        # divergence statistics over the last metrics_window predictions
+        self.history_depth = history_depth
+        self.history = {
+            "timestamp": RingBuffer(history_depth),
+            "consensus_prediction": RingBuffer(history_depth),
+            "divergence_percent": RingBuffer(history_depth),
+            "cycle_time_seconds": RingBuffer(history_depth),
+            "oracle_predictions": RingBuffer(history_depth, (n_oracles,)),
+            "oracle_weights": RingBuffer(history_depth, (n_oracles,))
         }
+        self.divergence_stats = RollingStats(metrics_window)
+        self.n_predictions = 0
+        self._records = None
+        
+        # Streaming correlation of oracle predictions for entanglement
+        # updates, tracked only within the band for a banded matrix
+        half_width = None
+        if isinstance(self.entanglement_matrix, BandedMatrix):
+            half_width = self.entanglement_matrix.half_width
+        self.prediction_correlation = StreamingCorrelation(
+            n_oracles, correlation_span, half_width
+        )
     
-    def _generate_entanglement_matrix(self) -> np.ndarray:
+    def _initialize_oracles(self):
+        """Initialize all oracles with quantum parameters"""
+        n = self.n_oracles
+        self.quantum_phase = self.rng.uniform(0, 2 * np.pi, n)
+        self.entanglement_strength = self.rng.uniform(0.7, 1.0, n)
+        self.coherence_time = self.rng.uniform(8.5, 9.5, n)
+        self.accuracy_score = np.ones(n)
+        self.last_update = np.full(n, datetime.now(timezone.utc).timestamp())
+    
+    @property
+    def oracle_states(self) -> List[OracleState]:
+        """Per-oracle dict-style views over the state vectors"""
+        return [OracleState(self, i) for i in range(self.n_oracles)]
+    
+    def _generate_entanglement_matrix(self):
         """
         Generate quantum entanglement matrix for oracle correlations
         Uses Bell state entanglement patterns
-        """
-        matrix = np.zeros((self.n_oracles, self.n_oracles))
         
-        for i in range(self.n_oracles):
-            for j in range(self.n_oracles):
-                if i == j:
-                    matrix[i, j] = 1.0
-                else:
-                    # Entanglement strength based on distance
-                    distance = abs(i - j)
-                    matrix[i, j] = np.exp(-distance / (self.n_oracles / 4))
-        
-        return matrix
+        Returns:
+            Dense ndarray, or a BandedMatrix when entanglement_cutoff is set
+            and the band holds at most half of the entries (otherwise dense
+            products are faster and nothing is dropped)
+        """
+        if self.entanglement_cutoff is not None:
+            half_width = BandedMatrix.decay_half_width(
+                self.n_oracles, self.entanglement_length, self.entanglement_cutoff
+            )
+            if BandedMatrix.band_density(self.n_oracles, half_width) <= 0.5:
+                return BandedMatrix.distance_decay(
+                    self.n_oracles, self.entanglement_length, self.entanglement_cutoff
+                )
+        
+        # Entanglement strength based on distance (1.0 on the diagonal)
+        index = np.arange(self.n_oracles)
+        distance = np.abs(index[:, None] - index[None, :])
+        return np.exp(-distance / self.entanglement_length)
     
     def quantum_consensus_prediction(self, market_data: np.ndarray) -> Dict:
         """
@@ -81,22 +509,11 @@ class QuantumOracleFeed:
         """
         start_time = time.time()
         
-        # Get predictions from all oracles
-        oracle_predictions = []
-        oracle_weights = []
-        
-        for oracle in self.oracle_states:
-            # Quantum-enhanced prediction from each oracle
-            pred = self._oracle_predict(oracle, market_data)
-            oracle_predictions.append(pred)
-            
-            # Weight by accuracy and entanglement
-            weight = oracle["accuracy_score"] * oracle["entanglement_strength"]
-            oracle_weights.append(weight)
+        # Quantum-enhanced predictions from all oracles
+        oracle_predictions = self._oracle_predict(market_data)
         
-        # Normalize weights
-        oracle_weights = np.array(oracle_weights)
-        oracle_weights /= np.sum(oracle_weights)
+        # Weight by accuracy and entanglement
+        oracle_weights = self._oracle_weights()
         
         # Apply quantum entanglement for consensus
         entangled_predictions = self._apply_entanglement_consensus(
@@ -107,175 +524,323 @@ class QuantumOracleFeed:
         consensus = np.sum(entangled_predictions * oracle_weights)
         
         # Calculate prediction divergence
-        divergence = self._calculate_divergence(
+        divergence = float(self._calculate_divergence(
             oracle_predictions, consensus
-        )
+        ))
         
         # Calculate cycle time
         cycle_time = time.time() - start_time
         
         # Store prediction
-        prediction_record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+        timestamp = datetime.now(timezone.utc)
+        columns = {
+            "timestamp": timestamp.timestamp(),
+            "consensus_prediction": consensus,
+            "divergence_percent": divergence * 100,
+            "cycle_time_seconds": cycle_time,
+            "oracle_predictions": oracle_predictions,
+            "oracle_weights": oracle_weights
+        }
+        for name, value in columns.items():
+            self.history[name].append(value)
+        self._records = None
+        self.divergence_stats.push(divergence * 100)
+        self.prediction_correlation.update(oracle_predictions)
+        self.n_predictions += 1
+        
+        return self._prediction_record(
+            timestamp.isoformat(), consensus, divergence * 100,
+            cycle_time, oracle_predictions.tolist(), oracle_weights.tolist()
+        )
+    
+    def batch_consensus(self, market_matrix: np.ndarray) -> Dict:
+        """
+        Consensus predictions for many market snapshots at once
+        
+        Every row is predicted against the current oracle state, exactly as
+        successive quantum_consensus_prediction calls would be without
+        accuracy updates in between, and all rows are appended to the
+        history together.
+        
+        Args:
+            market_matrix: (n_samples, n_features) market state vectors
+        
+        Returns:
+            Columnar results: "consensus_prediction", "divergence_percent" and
+            "divergence_achievement" arrays of shape (n_samples,),
+            "oracle_predictions" of shape (n_samples, n_oracles) and the
+            shared "oracle_weights", plus total cycle time and timestamp
+        """
+        start_time = time.time()
+        market_matrix = np.atleast_2d(np.asarray(market_matrix))
+        n_samples = len(market_matrix)
+        
+        oracle_predictions = self._oracle_predict(market_matrix)
+        oracle_weights = self._oracle_weights()
+        
+        entangled_predictions = self._apply_entanglement_consensus(
+            oracle_predictions, oracle_weights
+        )
+        consensus = entangled_predictions @ oracle_weights
+        divergence_percent = self._calculate_divergence(oracle_predictions, consensus) * 100
+        achievement = self._achievement(divergence_percent)
+        
+        cycle_time = time.time() - start_time
+        timestamp = datetime.now(timezone.utc)
+        
+        # Bulk history append, one row per sample
+        columns = {
+            "timestamp": np.full(n_samples, timestamp.timestamp()),
+            "consensus_prediction": consensus,
+            "divergence_percent": divergence_percent,
+            "cycle_time_seconds": np.full(n_samples, cycle_time / n_samples),
+            "oracle_predictions": oracle_predictions,
+            "oracle_weights": np.broadcast_to(oracle_weights, oracle_predictions.shape)
+        }
+        for name, values in columns.items():
+            self.history[name].extend(values)
+        self._records = None
+        self.divergence_stats.extend(divergence_percent)
+        self.prediction_correlation.update_batch(oracle_predictions)
+        self.n_predictions += n_samples
+        
+        return {
+            "timestamp": timestamp.isoformat(),
+            "n_samples": n_samples,
+            "n_oracles": self.n_oracles,
+            "consensus_prediction": consensus,
+            "divergence_percent": divergence_percent,
+            "divergence_achievement": achievement,
+            "oracle_predictions": oracle_predictions,
+            "oracle_weights": oracle_weights,
+            "target_divergence": self.target_divergence,
+            "cycle_time_seconds": float(cycle_time)
+        }
+    
+    def _prediction_record(self, timestamp: str, consensus: float, divergence_percent: float,
+                           cycle_time: float, oracle_predictions: List[float],
+                           oracle_weights: List[float]) -> Dict:
+        """History record for one consensus prediction"""
+        return {
+            "timestamp": timestamp,
             "consensus_prediction": float(consensus),
-            "divergence_percent": float(divergence * 100),
+            "divergence_percent": float(divergence_percent),
             "cycle_time_seconds": float(cycle_time),
             "n_oracles": self.n_oracles,
-            "oracle_predictions": [float(p) for p in oracle_predictions],
-            "oracle_weights": oracle_weights.tolist(),
+            "oracle_predictions": oracle_predictions,
+            "oracle_weights": oracle_weights,
             "target_divergence": self.target_divergence,
-            "divergence_achievement": float((self.target_divergence / (divergence * 100)) * 100)
+            "divergence_achievement": float(self._achievement(divergence_percent))
         }
+    
+    def _achievement(self, divergence_percent):
+        """Target over divergence in percent; inf when divergence is zero"""
+        with np.errstate(divide='ignore'):
+            return self.target_divergence / np.asarray(divergence_percent, dtype=np.float64) * 100
+    
+    def recent_predictions(self, n: Optional[int] = None) -> List[Dict]:
+        """
+        Prediction records rebuilt from the history buffers
         
-        self.prediction_history.append(prediction_record)
-        self.divergence_history.append(divergence * 100)
+        Args:
+            n: Number of most recent records (default: all retained)
         
-        return prediction_record
+        Returns:
+            Records oldest first, as returned by quantum_consensus_prediction
+        """
+        columns = {name: buffer.last(n) for name, buffer in self.history.items()}
+        return [
+            self._prediction_record(
+                datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+                consensus, divergence, cycle_time, predictions, weights
+            )
+            for timestamp, consensus, divergence, cycle_time, predictions, weights in zip(
+                columns["timestamp"].tolist(), columns["consensus_prediction"].tolist(),
+                columns["divergence_percent"].tolist(), columns["cycle_time_seconds"].tolist(),
+                columns["oracle_predictions"].tolist(), columns["oracle_weights"].tolist()
+            )
+        ]
     
-    def _oracle_predict(self, oracle: Dict, market_data: np.ndarray) -> float:
-        """Generate prediction from individual oracle"""
-        # Apply quantum phase to market data
-        phase = oracle["quantum_phase"]
-        phase_shifted = market_data * np.exp(1j * phase)
+    @property
+    def prediction_history(self) -> List[Dict]:
+        """
+        Retained prediction records, oldest first
         
-        # Extract real prediction
-        prediction = np.mean(np.abs(phase_shifted))
+        Built once and reused until the next prediction; treat the list
+        as read-only.
+        """
+        if self._records is None:
+            self._records = self.recent_predictions()
+        return self._records
+    
+    @property
+    def divergence_history(self) -> List[float]:
+        """Retained divergence percentages, oldest first"""
+        return self.history["divergence_percent"].last().tolist()
+    
+    def _oracle_weights(self) -> np.ndarray:
+        """Oracle voting weights: accuracy times entanglement, normalized"""
+        weights = self.accuracy_score * self.entanglement_strength
+        return weights / np.sum(weights)
+    
+    def _oracle_predict(self, market_data: np.ndarray) -> np.ndarray:
+        """
+        Generate predictions from all oracles
+        
+        Args:
+            market_data: Market state vector, or (n_samples, n_features) matrix
+        
+        Returns:
+            Predictions of shape (n_oracles,) or (n_samples, n_oracles)
+        """
+        # The quantum phase rotates the market data without changing its
+        # magnitude, so every oracle shares the same phase-shifted mean
+        prediction = np.mean(np.abs(market_data), axis=-1)[..., None]
         
         # Add quantum noise based on coherence time (use absolute value)
-        coherence_factor = oracle["coherence_time"] / self.cycle_seconds
-        noise_scale = abs(0.01 * (1 - coherence_factor))
-        noise = np.random.normal(0, max(noise_scale, 0.001))
+        coherence_factor = self.coherence_time / self.cycle_seconds
+        noise_scale = np.abs(0.01 * (1 - coherence_factor))
+        noise = self.rng.normal(
+            0, np.maximum(noise_scale, 0.001), prediction.shape[:-1] + (self.n_oracles,)
+        )
         
-        return float(np.clip(prediction + noise, 0, 1))
+        return np.clip(prediction + noise, 0, 1)
     
-    def _apply_entanglement_consensus(self, predictions: List[float],
+    def _apply_entanglement_consensus(self, predictions: np.ndarray,
                                      weights: np.ndarray) -> np.ndarray:
         """
         Apply quantum entanglement to oracle predictions
         Creates correlation through entanglement matrix
         """
-        predictions = np.array(predictions)
-        
-        # Apply entanglement matrix
-        entangled = self.entanglement_matrix @ predictions
+        # Apply entanglement matrix (row-wise for a prediction matrix)
+        if isinstance(self.entanglement_matrix, BandedMatrix):
+            entangled = self.entanglement_matrix.apply(predictions)
+        else:
+            entangled = predictions @ self.entanglement_matrix.T
         
         # Normalize back to valid range
-        entangled = entangled / np.max(np.abs(entangled))
+        entangled = entangled / np.max(np.abs(entangled), axis=-1, keepdims=True)
         
         return entangled
     
-    def _calculate_divergence(self, predictions: List[float],
-                             consensus: float) -> float:
+    def _calculate_divergence(self, predictions: np.ndarray, consensus) -> np.ndarray:
         """
         Calculate prediction divergence from consensus
         Target: 0.003% (0.00003 in decimal)
-        """
-        predictions = np.array(predictions)
         
+        Works row-wise when given a prediction matrix and a consensus
+        per row.
+        """
         # Mean absolute deviation from consensus
-        divergence = np.mean(np.abs(predictions - consensus))
-        
-        # Normalize to percentage
-        if abs(consensus) > 1e-6:
-            divergence = divergence / abs(consensus)
+        consensus = np.asarray(consensus)
+        divergence = np.mean(np.abs(predictions - consensus[..., None]), axis=-1)
         
-        return divergence
+        # Normalize to percentage (left as is for a near-zero consensus)
+        scale = np.abs(consensus)
+        return divergence / np.where(scale > 1e-6, scale, 1.0)
     
     def update_oracle_accuracy(self, actual_outcome: float):
         """
         Update oracle accuracy scores based on actual outcome
         Implements quantum reinforcement learning
         """
-        if not self.prediction_history:
+        if not self.n_predictions:
             return
         
-        last_prediction = self.prediction_history[-1]
-        oracle_predictions = last_prediction["oracle_predictions"]
+        oracle_predictions = self.history["oracle_predictions"].latest()
         
-        for i, oracle in enumerate(self.oracle_states):
-            # Calculate prediction error
-            error = abs(oracle_predictions[i] - actual_outcome)
-            
-            # Update accuracy using exponential moving average
-            decay = 0.95
-            oracle["accuracy_score"] = (
-                decay * oracle["accuracy_score"] + 
-                (1 - decay) * (1 - error)
-            )
-            
-            # Quantum phase adjustment based on error
-            phase_adjustment = error * 0.1 * np.sign(oracle_predictions[i] - actual_outcome)
-            oracle["quantum_phase"] += phase_adjustment
-            oracle["quantum_phase"] = oracle["quantum_phase"] % (2 * np.pi)
-            
-            oracle["last_update"] = datetime.now(timezone.utc).isoformat()
+        # Calculate prediction errors
+        error = np.abs(oracle_predictions - actual_outcome)
+        
+        # Update accuracy using exponential moving average
+        decay = 0.95
+        self.accuracy_score = decay * self.accuracy_score + (1 - decay) * (1 - error)
+        
+        # Quantum phase adjustment based on error
+        phase_adjustment = error * 0.1 * np.sign(oracle_predictions - actual_outcome)
+        self.quantum_phase = (self.quantum_phase + phase_adjustment) % (2 * np.pi)
+        
+        self.last_update[:] = datetime.now(timezone.utc).timestamp()
     
     def get_divergence_metrics(self) -> Dict:
         """Get comprehensive divergence metrics"""
-        if not self.divergence_history:
+        if not self.n_predictions:
             return {
                 "status": "NO_DATA",
                 "message": "No predictions recorded yet"
             }
         
-        recent_divergences = self.divergence_history[-100:]  # Last 100 predictions
+        # Rolling statistics over the last metrics_window predictions
+        stats = self.divergence_stats
         
         return {
-            "current_divergence_percent": float(recent_divergences[-1]),
+            "current_divergence_percent": float(self.history["divergence_percent"].latest()),
             "target_divergence_percent": self.target_divergence,
-            "mean_divergence_percent": float(np.mean(recent_divergences)),
-            "min_divergence_percent": float(np.min(recent_divergences)),
-            "max_divergence_percent": float(np.max(recent_divergences)),
-            "std_divergence_percent": float(np.std(recent_divergences)),
-            "achievement_percent": float((self.target_divergence / np.mean(recent_divergences)) * 100),
-            "status": "ON_TARGET" if np.mean(recent_divergences) <= self.target_divergence else "OPTIMIZING",
-            "n_predictions": len(self.prediction_history),
+            "mean_divergence_percent": stats.mean,
+            "min_divergence_percent": stats.min,
+            "max_divergence_percent": stats.max,
+            "std_divergence_percent": stats.std,
+            "achievement_percent": float(self._achievement(stats.mean)),
+            "status": "ON_TARGET" if stats.mean <= self.target_divergence else "OPTIMIZING",
+            "n_predictions": self.n_predictions,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
     def get_oracle_health(self) -> List[Dict]:
         """Get health status of all oracles"""
+        healthy = self.accuracy_score > 0.8
         return [
             {
-                "id": oracle["id"],
-                "accuracy_score": oracle["accuracy_score"],
-                "entanglement_strength": oracle["entanglement_strength"],
-                "coherence_time": oracle["coherence_time"],
-                "quantum_phase": oracle["quantum_phase"],
-                "status": "HEALTHY" if oracle["accuracy_score"] > 0.8 else "DEGRADED",
-                "last_update": oracle["last_update"]
+                "id": i,
+                "accuracy_score": accuracy,
+                "entanglement_strength": strength,
+                "coherence_time": coherence,
+                "quantum_phase": phase,
+                "status": "HEALTHY" if is_healthy else "DEGRADED",
+                "last_update": datetime.fromtimestamp(updated, timezone.utc).isoformat()
             }
-            for oracle in self.oracle_states
+            for i, (accuracy, strength, coherence, phase, is_healthy, updated) in enumerate(zip(
+                self.accuracy_score.tolist(), self.entanglement_strength.tolist(),
+                self.coherence_time.tolist(), self.quantum_phase.tolist(),
+                healthy.tolist(), self.last_update.tolist()
+            ))
         ]
     
     def optimize_entanglement(self):
         """
         Optimize quantum entanglement matrix
         Improves correlation patterns for better consensus
+        
+        Uses the streaming correlation of recent predictions, so it is
+        cheap enough to run every cycle.
         """
-        # Calculate correlation matrix from recent predictions
-        if len(self.prediction_history) < 10:
+        # Wait for roughly one span of predictions
+        if self.prediction_correlation.count < self.prediction_correlation.span:
             return
         
-        recent_predictions = self.prediction_history[-10:]
-        prediction_matrix = np.array([
-            pred["oracle_predictions"] 
-            for pred in recent_predictions
-        ])
+        correlation = self.prediction_correlation.correlation()
         
-        # Calculate correlation
-        correlation = np.corrcoef(prediction_matrix.T)
-        
-        # Update entanglement matrix with learned correlations
+        # Update entanglement matrix with learned correlations (in place)
         learning_rate = 0.1
-        self.entanglement_matrix = (
-            (1 - learning_rate) * self.entanglement_matrix +
-            learning_rate * np.abs(correlation)
-        )
+        np.abs(correlation, out=correlation)
+        if isinstance(self.entanglement_matrix, BandedMatrix):
+            # Correlations are tracked in the same band layout
+            self.entanglement_matrix.blend(correlation, learning_rate)
+            self.entanglement_matrix.normalize_rows()
+            return
         
-        # Normalize
-        for i in range(self.n_oracles):
-            self.entanglement_matrix[i] /= np.max(self.entanglement_matrix[i])
+        correlation *= learning_rate
+        self.entanglement_matrix *= 1 - learning_rate
+        self.entanglement_matrix += correlation
+        
+        # Normalize each row by its maximum
+        self.entanglement_matrix /= np.max(self.entanglement_matrix, axis=1, keepdims=True)
+    
+    def dense_entanglement_matrix(self) -> np.ndarray:
+        """Entanglement matrix as a dense array, whatever its representation"""
+        if isinstance(self.entanglement_matrix, BandedMatrix):
+            return self.entanglement_matrix.to_dense()
+        return self.entanglement_matrix
     
     def export_feed_state(self) -> Dict:
         """Export complete oracle feed state"""
@@ -285,12 +850,77 @@ class QuantumOracleFeed:
             "target_divergence": self.target_divergence,
             "oracle_health": self.get_oracle_health(),
             "divergence_metrics": self.get_divergence_metrics(),
-            "entanglement_matrix": self.entanglement_matrix.tolist(),
-            "prediction_history": self.prediction_history[-50:],  # Last 50
+            "entanglement_matrix": self.dense_entanglement_matrix().tolist(),
+            "prediction_history": self.recent_predictions(50),  # Last 50
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
 
+def compare_entanglement_paths(n_oracles: int, cutoff: float,
+                               length: Optional[float] = None,
+                               n_samples: int = 64, seed: Optional[int] = 0) -> Dict:
+    """
+    Accuracy and speed of banded entanglement against the dense path
+    
+    Both feeds share oracle parameters; random prediction matrices go
+    through each entanglement step and the consensus weighting. The band
+    is compared even where a feed with this cutoff would stay dense.
+    
+    Args:
+        n_oracles: Number of oracles
+        cutoff: Banded feed's entanglement_cutoff
+        length: Entanglement decay length (default n_oracles / 4)
+        n_samples: Prediction vectors compared
+        seed: Seed for the feeds and the predictions
+    
+    Returns:
+        Band size and density, maximum absolute errors of the entangled
+        predictions and consensus, the a priori error bound, and timings
+    """
+    dense_feed = QuantumOracleFeed(n_oracles, seed=seed, entanglement_length=length)
+    banded_feed = QuantumOracleFeed(n_oracles, seed=seed, entanglement_length=length)
+    banded = BandedMatrix.distance_decay(n_oracles, banded_feed.entanglement_length, cutoff)
+    banded_feed.entanglement_matrix = banded
+    predictions = np.random.default_rng(seed).uniform(0, 1, (n_samples, n_oracles))
+    weights = dense_feed._oracle_weights()
+    
+    # Best of a few runs each, after a warm-up that builds the sparse form
+    timings = {}
+    entangled = {}
+    for name, feed in (("dense", dense_feed), ("banded", banded_feed)):
+        entangled[name] = feed._apply_entanglement_consensus(predictions, weights)
+        runs = []
+        for _ in range(3):
+            start_time = time.perf_counter()
+            feed._apply_entanglement_consensus(predictions, weights)
+            runs.append(time.perf_counter() - start_time)
+        timings[name] = min(runs)
+    
+    # Raw products before the consensus normalization; with inputs in
+    # [0, 1] each product loses at most the dropped tail of its row
+    raw_error = np.abs(predictions @ dense_feed.entanglement_matrix.T - banded.apply(predictions))
+    decay = math.exp(-1 / banded_feed.entanglement_length)
+    error_bound = 2 * decay ** (banded.half_width + 1) / (1 - decay)
+    
+    return {
+        "n_oracles": n_oracles,
+        "cutoff": cutoff,
+        "entanglement_length": banded_feed.entanglement_length,
+        "half_width": banded.half_width,
+        "density": banded.density,
+        "feed_uses_band": banded.density <= 0.5,
+        "backend": "scipy.sparse" if sparse is not None else "numpy",
+        "max_abs_error": float(raw_error.max()),
+        "error_bound": float(error_bound),
+        "entangled_max_abs_error": float(np.abs(entangled["dense"] - entangled["banded"]).max()),
+        "consensus_max_abs_error": float(np.abs(
+            entangled["dense"] @ weights - entangled["banded"] @ weights
+        ).max()),
+        "dense_seconds": timings["dense"],
+        "banded_seconds": timings["banded"]
+    }
+
+
 def main():
     """Demonstration of Oracle Feed System"""
     print("🔮 Oracle Feed System - Phase 38")
@@ -319,9 +949,8 @@ def main():
         actual_outcome = prediction["consensus_prediction"] + np.random.normal(0, 0.02)
         oracle_feed.update_oracle_accuracy(actual_outcome)
         
-        # Periodically optimize entanglement
-        if cycle % 5 == 4:
-            oracle_feed.optimize_entanglement()
+        # Adapt entanglement every cycle
+        oracle_feed.optimize_entanglement()
         
         if cycle < 3 or cycle >= 8:  # Show first 3 and last 2
             print(f"\n   Cycle {cycle + 1}:")
@@ -355,7 +984,7 @@ def main():
         json.dump(feed_state, f, indent=2)
     
     print(f"   Feed state exported: oracle_feed_state.json")
-    print(f"   Total Predictions: {len(oracle_feed.prediction_history)}")
+    print(f"   Total Predictions: {oracle_feed.n_predictions}")
     
     print("\n✅ Oracle Feed System Complete")
     print("=" * 70)
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Quantum Sub-Node Cluster Benchmark
+Phase 38 Blueprint - Throughput, latency and failover regression checks
+
+Sweeps QuantumSubNodeCluster configurations and measures:
+- Batch engine throughput (tasks/sec) and batch latency per batch size
+- Single-task latency (p50/p99) through distribute_task
+- Failover overhead under injected task failure rates
+
+Results are written as JSON and compared against a stored baseline.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+from datetime import datetime, timezone
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+
+from quantum_subnodes import QuantumSubNode, QuantumSubNodeCluster
+
+
+BENCHMARK_FORMAT_VERSION = 1
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), '../config/phase38-cluster-benchmark-baseline.json'
+)
+
+# Metrics compared against the baseline, by direction
+HIGHER_IS_BETTER = ["tasks_per_sec"]
+LOWER_IS_BETTER = ["latency_p50_us", "latency_p99_us", "failover_overhead_us"]
+
+# Baseline values below this are too small to compare by ratio (e.g. a
+# failover overhead of a few microseconds is timer noise)
+MIN_COMPARABLE = {
+    "tasks_per_sec": 0.0,
+    "latency_p50_us": 1.0,
+    "latency_p99_us": 1.0,
+    "failover_overhead_us": 20.0
+}
+
+# Tail latency is noisier than medians, so it gets a wider tolerance band
+TOLERANCE_SCALE = {
+    "latency_p99_us": 2.0
+}
+
+
+def fault_injecting_node_class(failure_rate: float, rng: np.random.Generator) -> type:
+    """
+    QuantumSubNode subclass whose tasks fail with probability failure_rate
+    
+    The failure is raised while encoding, so process_task records it and
+    returns a FAILED result exactly as for a real fault. The subclass adds
+    no slots, so existing nodes can be switched to it via __class__.
+    """
+    def _encode_task(self, task_data: np.ndarray) -> np.ndarray:
+        if rng.random() < failure_rate:
+            raise RuntimeError("Injected failure")
+        return QuantumSubNode._encode_task(self, task_data)
+    
+    return type("FaultInjectingSubNode", (QuantumSubNode,), {
+        "__slots__": (),
+        "_encode_task": _encode_task
+    })
+
+
+def _percentiles_us(samples: Sequence[float]) -> Dict:
+    p50, p99 = np.percentile(np.asarray(samples) * 1e6, [50, 99])
+    return {"latency_p50_us": float(p50), "latency_p99_us": float(p99)}
+
+
+def benchmark_batch(cluster: QuantumSubNodeCluster, batch_size: int, repeats: int,
+                    rng: np.random.Generator) -> Dict:
+    """
+    Throughput and per-batch latency of the vectorized batch engine
+    
+    Args:
+        cluster: Cluster to measure (sequential mode)
+        batch_size: Tasks per distribute_batch call
+        repeats: Timed batches (one untimed warm-up batch runs first)
+        rng: Generator for task data
+    
+    Returns:
+        tasks_per_sec and batch latency percentiles in microseconds
+    """
+    tasks = rng.standard_normal((batch_size, 2 ** cluster.qubits_per_node))
+    cluster.distribute_batch(tasks)
+    
+    timings = []
+    for _ in range(repeats):
+        cluster.heartbeat()
+        start_time = time.perf_counter()
+        cluster.distribute_batch(tasks)
+        timings.append(time.perf_counter() - start_time)
+    
+    return {
+        "tasks_per_sec": batch_size * repeats / sum(timings),
+        **_percentiles_us(timings)
+    }
+
+
+def benchmark_tasks(cluster: QuantumSubNodeCluster, n_tasks: int, failure_rate: float,
+                    rng: np.random.Generator) -> Dict:
+    """
+    Single-task latency through distribute_task with injected failures
+    
+    Every node fails each task with probability failure_rate, so failed
+    tasks go through the backup failover path. The cluster heartbeat runs
+    once per n_nodes tasks to keep loads in steady state.
+    
+    Args:
+        cluster: Cluster to measure (sequential mode)
+        n_tasks: Timed tasks
+        failure_rate: Probability that a node fails a task
+        rng: Generator for task data and failure draws
+    
+    Returns:
+        tasks_per_sec, latency percentiles, observed failover and
+        failure rates, and failover_overhead_us (mean latency of
+        failed-over tasks minus that of tasks served directly)
+    """
+    node_class = fault_injecting_node_class(failure_rate, rng)
+    for node in cluster.nodes:
+        node.__class__ = node_class
+    
+    tasks = rng.standard_normal((n_tasks, 2 ** cluster.qubits_per_node))
+    latencies = np.empty(n_tasks)
+    failed_over = np.zeros(n_tasks, dtype=bool)
+    failed = np.zeros(n_tasks, dtype=bool)
+    
+    try:
+        for i in range(n_tasks):
+            if i % cluster.n_nodes == 0:
+                cluster.heartbeat()
+            start_time = time.perf_counter()
+            result = cluster.distribute_task(tasks[i])
+            latencies[i] = time.perf_counter() - start_time
+            failed_over[i] = result.get("failover", False)
+            failed[i] = result["status"] != "SUCCESS"
+    finally:
+        for node in cluster.nodes:
+            node.__class__ = QuantumSubNode
+    
+    direct = ~failed_over & ~failed
+    overhead = 0.0
+    if failed_over.any() and direct.any():
+        overhead = float((latencies[failed_over].mean() - latencies[direct].mean()) * 1e6)
+    
+    return {
+        "tasks_per_sec": n_tasks / latencies.sum(),
+        **_percentiles_us(latencies),
+        "failover_rate": float(failed_over.mean()),
+        "failure_rate_observed": float(failed.mean()),
+        "failover_overhead_us": overhead
+    }
+
+
+def result_key(result: Dict) -> str:
+    """Identifier matching a result to its baseline entry"""
+    if result["mode"] == "batch":
+        variable = f"batch={result['batch_size']}"
+    else:
+        variable = f"failure_rate={result['failure_rate']}"
+    return f"{result['mode']}:nodes={result['n_nodes']},qubits={result['qubits_per_node']},{variable}"
+
+
+def run_benchmark(node_counts: Sequence[int] = (24, 1000, 10000),
+                  qubit_counts: Sequence[int] = (4, 6),
+                  batch_sizes: Sequence[int] = (64, 1024),
+                  failure_rates: Sequence[float] = (0.0, 0.05, 0.2),
+                  n_tasks: int = 2000, repeats: int = 20,
+                  scheduler: str = "least_loaded", seed: Optional[int] = 0) -> Dict:
+    """
+    Sweep cluster configurations
+    
+    Each (nodes, qubits) pair gets a fresh seeded cluster per measurement:
+    one batch-engine run per batch size and one distribute_task run per
+    failure rate.
+    
+    Args:
+        node_counts: Cluster sizes
+        qubit_counts: Qubits per node
+        batch_sizes: Tasks per distribute_batch call
+        failure_rates: Injected per-task node failure probabilities
+        n_tasks: Tasks per distribute_task run
+        repeats: Timed batches per batch run
+        scheduler: Node selection policy
+        seed: Root seed for clusters, task data and failure draws
+    
+    Returns:
+        Settings, environment and one result per configuration
+    """
+    seed_sequence = np.random.SeedSequence(seed)
+    results = []
+    
+    for n_nodes in node_counts:
+        for qubits in qubit_counts:
+            runs = [("batch", size) for size in batch_sizes]
+            runs += [("task", rate) for rate in failure_rates]
+            
+            for (mode, value), run_seed in zip(runs, seed_sequence.spawn(len(runs))):
+                cluster_seed, data_seed = run_seed.spawn(2)
+                cluster = QuantumSubNodeCluster(
+                    n_nodes=n_nodes, qubits_per_node=qubits,
+                    scheduler=scheduler, seed=cluster_seed
+                )
+                rng = np.random.default_rng(data_seed)
+                
+                result = {"mode": mode, "n_nodes": n_nodes, "qubits_per_node": qubits}
+                if mode == "batch":
+                    result["batch_size"] = value
+                    result.update(benchmark_batch(cluster, value, repeats, rng))
+                else:
+                    result["failure_rate"] = value
+                    result.update(benchmark_tasks(cluster, n_tasks, value, rng))
+                result["key"] = result_key(result)
+                results.append(result)
+    
+    return {
+        "format_version": BENCHMARK_FORMAT_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count()
+        },
+        "settings": {
+            "node_counts": list(node_counts),
+            "qubit_counts": list(qubit_counts),
+            "batch_sizes": list(batch_sizes),
+            "failure_rates": list(failure_rates),
+            "n_tasks": n_tasks,
+            "repeats": repeats,
+            "scheduler": scheduler,
+            "seed": seed
+        },
+        "results": results
+    }
+
+
+def compare_to_baseline(report: Dict, baseline: Dict, tolerance: float = 0.25) -> Dict:
+    """
+    Flag metrics that moved past tolerance relative to the baseline
+    
+    Args:
+        report: Output of run_benchmark
+        baseline: Stored run_benchmark output
+        tolerance: Allowed relative change (0.25 = 25%), scaled per
+            metric by TOLERANCE_SCALE
+    
+    Returns:
+        "regressions" and "improvements" (key, metric, baseline, current,
+        relative change), configurations missing from the baseline, and
+        "passed" when nothing regressed
+    """
+    if baseline.get("format_version") != BENCHMARK_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported baseline format {baseline.get('format_version')}, "
+            f"expected {BENCHMARK_FORMAT_VERSION}"
+        )
+    
+    baseline_results = {result["key"]: result for result in baseline["results"]}
+    regressions = []
+    improvements = []
+    missing = []
+    
+    for result in report["results"]:
+        reference = baseline_results.get(result["key"])
+        if reference is None:
+            missing.append(result["key"])
+            continue
+        
+        for metric in HIGHER_IS_BETTER + LOWER_IS_BETTER:
+            if metric not in result or metric not in reference:
+                continue
+            base_value = reference[metric]
+            if base_value <= MIN_COMPARABLE[metric]:
+                continue
+            
+            change = (result[metric] - base_value) / base_value
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            entry = {
+                "key": result["key"],
+                "metric": metric,
+                "baseline": base_value,
+                "current": result[metric],
+                "change": change
+            }
+            allowed = tolerance * TOLERANCE_SCALE.get(metric, 1.0)
+            if worse > allowed:
+                regressions.append(entry)
+            elif worse < -allowed:
+                improvements.append(entry)
+    
+    return {
+        "passed": not regressions,
+        "tolerance": tolerance,
+        "compared": len(report["results"]) - len(missing),
+        "regressions": regressions,
+        "improvements": improvements,
+        "missing": missing
+    }
+
+
+def main():
+    """Benchmark command line entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Phase 38 Quantum Sub-Node Cluster Benchmark"
+    )
+    parser.add_argument('--nodes', type=int, nargs='+', default=[24, 1000, 10000],
+                        help='Cluster sizes to sweep')
+    parser.add_argument('--qubits', type=int, nargs='+', default=[4, 6],
+                        help='Qubits per node to sweep')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[64, 1024],
+                        help='Batch sizes for the batch engine')
+    parser.add_argument('--failure-rates', type=float, nargs='+', default=[0.0, 0.05, 0.2],
+                        help='Injected per-task failure probabilities')
+    parser.add_argument('--tasks', type=int, default=2000,
+                        help='Tasks per single-task latency run')
+    parser.add_argument('--repeats', type=int, default=20,
+                        help='Timed batches per batch run')
+    parser.add_argument('--scheduler', type=str, default='least_loaded',
+                        help='Node selection policy')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Root seed')
+    parser.add_argument('--output', type=str,
+                        help='Write results JSON to this path')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE,
+                        help='Baseline JSON to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative change before a regression is reported')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store these results as the new baseline')
+    
+    args = parser.parse_args()
+    
+    print("⏱️  Quantum Sub-Node Cluster Benchmark - Phase 38")
+    print("=" * 70)
+    
+    report = run_benchmark(
+        node_counts=args.nodes, qubit_counts=args.qubits,
+        batch_sizes=args.batch_sizes, failure_rates=args.failure_rates,
+        n_tasks=args.tasks, repeats=args.repeats,
+        scheduler=args.scheduler, seed=args.seed
+    )
+    
+    print(f"\n   {'configuration':<48}{'tasks/s':>12}{'p50 us':>10}{'p99 us':>10}{'failover us':>13}")
+    for result in report["results"]:
+        overhead = result.get("failover_overhead_us")
+        print(
+            f"   {result['key']:<48}{result['tasks_per_sec']:>12.0f}"
+            f"{result['latency_p50_us']:>10.1f}{result['latency_p99_us']:>10.1f}"
+            f"{'' if overhead is None else f'{overhead:.1f}':>13}"
+        )
+    
+    exit_code = 0
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Baseline updated: {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as f:
+            comparison = compare_to_baseline(report, json.load(f), args.tolerance)
+        report["comparison"] = comparison
+        
+        print(f"\n📊 Baseline Comparison (tolerance {args.tolerance:.0%}):")
+        print(f"   Compared: {comparison['compared']}, missing from baseline: {len(comparison['missing'])}")
+        for entry in comparison["improvements"]:
+            print(f"   ✓ {entry['key']} {entry['metric']}: {entry['change']:+.1%}")
+        for entry in comparison["regressions"]:
+            print(f"   ✗ {entry['key']} {entry['metric']}: {entry['change']:+.1%}")
+        print(f"   Status: {'PASS' if comparison['passed'] else 'REGRESSION'}")
+        exit_code = 0 if comparison["passed"] else 1
+    else:
+        print(f"\n⚠️  No baseline at {args.baseline} (run with --update-baseline)")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results exported: {args.output}")
+    
+    print("\n✅ Benchmark Complete")
+    print("=" * 70)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Quantum Sub-Node Scheduler
+Phase 38 Blueprint - Task placement for the sub-node cluster
+
+Pluggable node selection policies for QuantumSubNodeCluster:
+- Least-loaded selection on an indexed min-heap (O(log n) update)
+- Power-of-two-choices sampling (O(1) selection)
+- Weighted round-robin by processing capacity (stride scheduling)
+"""
+
+import numpy as np
+import time
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# Highest load at which an operational node still counts as available
+AVAILABLE_LOAD = 0.9
+
+# Statuses that never receive tasks, not even as the least-loaded fallback
+EXCLUDED_STATUSES = ("DRAINING", "REMOVED")
+
+
+class IndexedMinHeap:
+    """
+    Binary min-heap over items 0..n-1 with a position index
+    
+    Every item has a sortable key; changing one key re-sifts only that
+    item, so selection is O(1) and updates are O(log n).
+    """
+    
+    def __init__(self, keys: Sequence[Tuple], order: Optional[Sequence[int]] = None):
+        self.keys = list(keys)
+        
+        # A sorted list already satisfies the heap property
+        if order is None:
+            self.heap = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        else:
+            self.heap = list(order)
+        position = np.empty(len(self.heap), dtype=np.intp)
+        position[self.heap] = np.arange(len(self.heap))
+        self.position = position.tolist()
+    
+    def __len__(self) -> int:
+        return len(self.heap)
+    
+    def peek(self) -> int:
+        """Item with the smallest key"""
+        return self.heap[0]
+    
+    def push(self, key: Tuple) -> int:
+        """Add a new item and return its index"""
+        item = len(self.keys)
+        self.keys.append(key)
+        self.position.append(len(self.heap))
+        self.heap.append(item)
+        self._sift_up(len(self.heap) - 1)
+        return item
+    
+    def update(self, item: int, key: Tuple):
+        """Change an item's key and restore the heap property"""
+        old_key = self.keys[item]
+        self.keys[item] = key
+        if key < old_key:
+            self._sift_up(self.position[item])
+        elif key > old_key:
+            self._sift_down(self.position[item])
+    
+    def _swap(self, a: int, b: int):
+        heap = self.heap
+        heap[a], heap[b] = heap[b], heap[a]
+        self.position[heap[a]] = a
+        self.position[heap[b]] = b
+    
+    def _sift_up(self, slot: int):
+        heap, keys = self.heap, self.keys
+        while slot > 0:
+            parent = (slot - 1) >> 1
+            if keys[heap[slot]] >= keys[heap[parent]]:
+                break
+            self._swap(slot, parent)
+            slot = parent
+    
+    def _sift_down(self, slot: int):
+        heap, keys = self.heap, self.keys
+        size = len(heap)
+        while True:
+            child = 2 * slot + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            if keys[heap[child]] >= keys[heap[slot]]:
+                break
+            self._swap(slot, child)
+            slot = child
+
+
+class NodeScheduler:
+    """
+    Base class for node selection policies
+    
+    Schedulers register themselves as each node's load listener, so any
+    change to node.load or node.status re-keys that node via update().
+    Nodes joining or leaving the cluster are announced through add_node()
+    and remove_node().
+    """
+    
+    policy = "base"
+    
+    def __init__(self, nodes: List, seed=None):
+        self.nodes = nodes
+        
+        # Random stream for policies that sample
+        self.rng = np.random.default_rng(seed)
+        
+        # Optional SubNodeStore backing the nodes, for vectorized re-keying
+        self.store = None
+        
+        for index, node in enumerate(nodes):
+            node.load_listener = partial(self.update, index)
+    
+    def is_available(self, node) -> bool:
+        """Operational and below the availability threshold"""
+        return node.status == "OPERATIONAL" and node.load < AVAILABLE_LOAD
+    
+    def fallback_key(self, index: int) -> Tuple:
+        """Key of an unavailable node: by load, excluded statuses last"""
+        node = self.nodes[index]
+        if node.status in EXCLUDED_STATUSES:
+            return (True, np.inf, index)
+        return (True, node.load, index)
+    
+    def node_key(self, index: int) -> Tuple:
+        """
+        Ordering key used by distribute_task: available nodes first by
+        load / capacity, otherwise the least-loaded node; ties go to the
+        lowest index
+        """
+        node = self.nodes[index]
+        load = node.load
+        if load < AVAILABLE_LOAD and node.status == "OPERATIONAL":
+            return (False, load / node.processing_capacity, index)
+        return self.fallback_key(index)
+    
+    def select(self) -> int:
+        """Index of the node that takes the next task"""
+        raise NotImplementedError
+    
+    def update(self, index: int):
+        """Node index changed load or status"""
+    
+    def refresh(self):
+        """Re-key every node after a bulk change (e.g. cluster heartbeat)"""
+    
+    def add_node(self, index: int):
+        """Node index was appended to the node list"""
+        self.nodes[index].load_listener = partial(self.update, index)
+    
+    def remove_node(self, index: int):
+        """Node index left the cluster (its status is already REMOVED)"""
+        self.update(index)
+    
+    def assign(self, n_tasks: int, task_load: float = 0.1,
+               max_load: float = 1.0) -> np.ndarray:
+        """
+        Place n_tasks one after another, charging task_load per task
+        
+        Returns:
+            Node index per task
+        """
+        assignment = np.empty(n_tasks, dtype=np.intp)
+        for task in range(n_tasks):
+            index = self.select()
+            node = self.nodes[index]
+            node.load = min(max_load, node.load + task_load)
+            assignment[task] = index
+        return assignment
+
+
+class LeastLoadedScheduler(NodeScheduler):
+    """Exact least-loaded selection on an indexed min-heap"""
+    
+    policy = "least_loaded"
+    
+    def __init__(self, nodes: List, seed=None):
+        super().__init__(nodes, seed)
+        self.heap = IndexedMinHeap([self.node_key(i) for i in range(len(nodes))])
+    
+    def select(self) -> int:
+        return self.heap.peek()
+    
+    def update(self, index: int):
+        self.heap.update(index, self.node_key(index))
+    
+    def add_node(self, index: int):
+        super().add_node(index)
+        self.heap.push(self.node_key(index))
+    
+    def refresh(self):
+        if self.store is None or self.store.n_nodes != len(self.nodes):
+            self.heap = IndexedMinHeap([self.node_key(i) for i in range(len(self.nodes))])
+            return
+        
+        # Same keys as node_key, built and ordered from the store arrays
+        store = self.store
+        unavailable = ~((store.status == store.operational_code) & (store.load < AVAILABLE_LOAD))
+        excluded = np.isin(store.status, [store.status_code(name) for name in EXCLUDED_STATUSES])
+        score = np.where(unavailable, store.load, store.load / store.capacity)
+        score[excluded] = np.inf
+        index = np.arange(store.n_nodes)
+        keys = list(zip(unavailable.tolist(), score.tolist(), index.tolist()))
+        self.heap = IndexedMinHeap(keys, order=np.lexsort((index, score, unavailable)).tolist())
+
+
+class PowerOfTwoChoicesScheduler(NodeScheduler):
+    """
+    Sample two nodes at random and keep the better one
+    
+    O(1) per task with no shared ordering to maintain; the maximum load
+    stays within O(log log n) of the average. Candidates are drawn from
+    a swap-remove list of the nodes not draining or removed.
+    """
+    
+    policy = "power_of_two"
+    
+    def __init__(self, nodes: List, seed=None, buffer_size: int = 1024):
+        super().__init__(nodes, seed)
+        self.buffer_size = buffer_size
+        self._choices = np.empty((0, 2), dtype=np.intp)
+        self._next = 0
+        
+        self.members = [i for i, node in enumerate(nodes) if node.status not in EXCLUDED_STATUSES]
+        self.member_position = {index: slot for slot, index in enumerate(self.members)}
+    
+    def select(self) -> int:
+        # Draw candidate pairs in blocks to amortize the generator call
+        if self._next >= len(self._choices):
+            self._choices = self.rng.integers(0, len(self.members), size=(self.buffer_size, 2))
+            self._next = 0
+        first, second = self._choices[self._next]
+        self._next += 1
+        return min(self.members[first], self.members[second], key=self.node_key)
+    
+    def update(self, index: int):
+        # Membership follows status changes into and out of draining
+        excluded = self.nodes[index].status in EXCLUDED_STATUSES
+        if excluded != (index not in self.member_position):
+            if excluded:
+                slot = self.member_position.pop(index)
+                last = self.members.pop()
+                if last != index:
+                    self.members[slot] = last
+                    self.member_position[last] = slot
+            else:
+                self.member_position[index] = len(self.members)
+                self.members.append(index)
+            # Buffered draws were made for the old member count
+            self._next = len(self._choices)
+    
+    def add_node(self, index: int):
+        super().add_node(index)
+        self.update(index)
+
+
+class WeightedRoundRobinScheduler(NodeScheduler):
+    """
+    Weighted round-robin by processing capacity (stride scheduling)
+    
+    Each node advances a virtual pass by 1 / capacity when chosen and the
+    available node with the smallest pass goes next, so placements follow
+    capacity shares regardless of load. Unavailable nodes are held at the
+    current virtual time so they do not receive a burst on return.
+    """
+    
+    policy = "weighted_round_robin"
+    
+    def __init__(self, nodes: List, seed=None):
+        super().__init__(nodes, seed)
+        self.virtual_time = 0.0
+        self.passes = [0.0] * len(nodes)
+        self.heap = IndexedMinHeap([self.node_key(i) for i in range(len(nodes))])
+    
+    def node_key(self, index: int) -> Tuple:
+        node = self.nodes[index]
+        if self.is_available(node):
+            return (False, self.passes[index], index)
+        return self.fallback_key(index)
+    
+    def select(self) -> int:
+        index = self.heap.peek()
+        self.virtual_time = max(self.virtual_time, self.passes[index])
+        self.passes[index] += 1.0 / self.nodes[index].processing_capacity
+        self.heap.update(index, self.node_key(index))
+        return index
+    
+    def update(self, index: int):
+        if not self.is_available(self.nodes[index]):
+            self.passes[index] = max(self.passes[index], self.virtual_time)
+        self.heap.update(index, self.node_key(index))
+    
+    def add_node(self, index: int):
+        super().add_node(index)
+        # Join at the current virtual time rather than with a burst
+        self.passes.append(self.virtual_time)
+        self.heap.push(self.node_key(index))
+    
+    def refresh(self):
+        for index, node in enumerate(self.nodes):
+            if not self.is_available(node):
+                self.passes[index] = max(self.passes[index], self.virtual_time)
+        self.heap = IndexedMinHeap([self.node_key(i) for i in range(len(self.nodes))])
+
+
+SCHEDULERS = {
+    "least_loaded": LeastLoadedScheduler,
+    "power_of_two": PowerOfTwoChoicesScheduler,
+    "weighted_round_robin": WeightedRoundRobinScheduler
+}
+
+
+def make_scheduler(scheduler, nodes: List, seed=None) -> NodeScheduler:
+    """Build a scheduler from a policy name, class or instance (seeded if built)"""
+    if isinstance(scheduler, NodeScheduler):
+        return scheduler
+    if isinstance(scheduler, str):
+        if scheduler not in SCHEDULERS:
+            raise ValueError(
+                f"Unknown scheduler '{scheduler}', expected one of {sorted(SCHEDULERS)}"
+            )
+        scheduler = SCHEDULERS[scheduler]
+    return scheduler(nodes, seed=seed)
+
+
+def _linear_scan(nodes: List) -> int:
+    """Reference selection: list filter plus min, as distribute_task did"""
+    available_nodes = [
+        node for node in nodes
+        if node.status == "OPERATIONAL" and node.load < AVAILABLE_LOAD
+    ]
+    if not available_nodes:
+        return min(nodes, key=lambda n: n.load).node_id
+    return min(available_nodes, key=lambda n: n.load / n.processing_capacity).node_id
+
+
+def benchmark_schedulers(node_counts: Sequence[int] = (24, 1000, 100000),
+                         n_tasks: int = 5000, heartbeat_every: int = 100) -> Dict:
+    """
+    Time one scheduling decision plus its load update per policy
+    
+    Each task is placed and charged its load; every heartbeat_every tasks
+    one node decays, so selections keep moving across the cluster. The
+    linear scan runs with the nodes' load listeners detached, so its
+    load writes do not pay for heap updates.
+    
+    Args:
+        node_counts: Cluster sizes to measure
+        n_tasks: Tasks placed per policy (the linear scan is capped to
+            about 2M node visits)
+        heartbeat_every: Tasks between single-node heartbeats
+    
+    Returns:
+        Microseconds per task by cluster size and policy
+    """
+    from quantum_subnodes import QuantumSubNodeCluster
+    
+    results = {}
+    for n_nodes in node_counts:
+        cluster = QuantumSubNodeCluster(n_nodes=n_nodes, qubits_per_node=1)
+        timings = {}
+        
+        for policy in ["linear_scan"] + list(SCHEDULERS):
+            for node in cluster.nodes:
+                node.load = 0.0
+            
+            if policy == "linear_scan":
+                # No scheduler listening, so load writes cost what they
+                # did before the heap existed
+                for node in cluster.nodes:
+                    node.load_listener = None
+                select = lambda: _linear_scan(cluster.nodes)
+                policy_tasks = max(10, min(n_tasks, 2000000 // n_nodes))
+            else:
+                cluster.set_scheduler(policy)
+                select = cluster.scheduler.select
+                policy_tasks = n_tasks
+            
+            start_time = time.perf_counter()
+            for task in range(policy_tasks):
+                node = cluster.nodes[select()]
+                node.load = min(1.0, node.load + 0.1)
+                if task % heartbeat_every == 0:
+                    cluster.nodes[task % n_nodes].heartbeat()
+            elapsed = time.perf_counter() - start_time
+            
+            timings[policy] = elapsed / policy_tasks * 1e6
+        
+        results[n_nodes] = timings
+    
+    return results
+
+
+def main():
+    """Demonstration of sub-node scheduling policies"""
+    print("🧭 Quantum Sub-Node Scheduler - Phase 38")
+    print("   Scheduling cost per task (microseconds)")
+    print("=" * 70)
+    
+    results = benchmark_schedulers()
+    policies = ["linear_scan"] + list(SCHEDULERS)
+    
+    print(f"\n   {'nodes':>8}" + "".join(f"{policy:>22}" for policy in policies))
+    for n_nodes, timings in results.items():
+        print(f"   {n_nodes:>8}" + "".join(f"{timings[p]:>22.2f}" for p in policies))
+    
+    print("\n✅ Scheduler Benchmark Complete")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,47 +10,485 @@ Implements distributed quantum computing nodes with:
 - Failover and self-healing capabilities
 """
 
+import asyncio
 import numpy as np
 import json
+import sys
+import os
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 import hashlib
+import queue
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import nullcontext
+from multiprocessing import shared_memory
+
+sys.path.append(os.path.dirname(__file__))
+
+from tensorflow_quantum_integration import PRECISIONS, compile_circuit, spawn_seeds
+from quantum_scheduler import AVAILABLE_LOAD, EXCLUDED_STATUSES, make_scheduler
+
+
+# Node status names; a store assigns codes to any other name on first use
+NODE_STATUSES = ["INITIALIZING", "OPERATIONAL", "DEGRADED", "OFFLINE", "DRAINING", "REMOVED"]
+
+# Load removed from every node per heartbeat in sequential mode
+HEARTBEAT_DECAY = 0.05
+
+# Per-row fields of a SubNodeStore alongside its state matrix:
+# (name, dtype, columns or None for a vector)
+STORE_FIELDS = [
+    ("load", np.float64, None),
+    ("capacity", np.float64, None),
+    ("last_heartbeat", np.float64, None),
+    ("tasks_completed", np.int64, None),
+    ("tasks_failed", np.int64, None),
+    ("backup_nodes", np.int64, 2),
+    ("primary_node", np.int64, None),
+    ("status", np.int8, None)
+]
+
+# Rows initialized per step by SubNodeStore.initialize_rows, bounding
+# temporary memory when large clusters are built
+INIT_CHUNK_ROWS = 4096
+
+
+class SubNodeStore:
+    """
+    Struct-of-arrays storage for sub-nodes
+    
+    One row per node in a state matrix and in load, capacity, task
+    counter, redundancy, status code and last heartbeat vectors, all laid
+    out in a single buffer. grow() appends rows by reallocating it.
+    With shared=True the buffer is a shared memory block that other
+    processes map through attach() without copying.
+    
+    Running totals are adjusted on every write, so the cluster-wide
+    aggregates behind health snapshots are O(1) reads. They are kept per
+    process; an attached store recounts them from the arrays.
+    """
+    
+    def __init__(self, n_nodes: int, state_dim: int = 1, dtype=np.complex128,
+                 shared: bool = False):
+        self.n_nodes = n_nodes
+        self.state_dim = state_dim
+        self.dtype = np.dtype(dtype)
+        
+        layout, self.nbytes = self.layout(n_nodes, state_dim, self.dtype)
+        if shared:
+            self.segment = shared_memory.SharedMemory(create=True, size=max(1, self.nbytes))
+            self.segment.buf[:self.nbytes] = bytes(self.nbytes)
+            buffer = self.segment.buf
+        else:
+            self.segment = None
+            buffer = np.zeros(max(1, self.nbytes), dtype=np.uint8)
+        self._owner = True
+        self._map(layout, buffer)
+        
+        self._fill_defaults(slice(None))
+        
+        self._set_status_names(NODE_STATUSES)
+        self.recount()
+    
+    def _fill_defaults(self, rows):
+        self.capacity[rows] = 1.0
+        self.last_heartbeat[rows] = time.time()
+        self.backup_nodes[rows] = -1
+        self.primary_node[rows] = -1
+    
+    @staticmethod
+    def layout(n_nodes: int, state_dim: int, dtype) -> Tuple[List[Tuple], int]:
+        """
+        Field placement within the store buffer
+        
+        Returns:
+            (name, shape, dtype, offset) per field and the total byte size
+        """
+        fields = [("state", (n_nodes, state_dim), np.dtype(dtype))]
+        fields += [
+            (name, (n_nodes,) if columns is None else (n_nodes, columns), np.dtype(field_dtype))
+            for name, field_dtype, columns in STORE_FIELDS
+        ]
+        
+        layout = []
+        offset = 0
+        for name, shape, field_dtype in fields:
+            # Keep every field aligned for its element type
+            offset = -(-offset // field_dtype.alignment) * field_dtype.alignment
+            layout.append((name, shape, field_dtype, offset))
+            offset += int(np.prod(shape)) * field_dtype.itemsize
+        return layout, offset
+    
+    def _map(self, layout: List[Tuple], buffer):
+        for name, shape, field_dtype, offset in layout:
+            setattr(self, name, np.ndarray(shape, dtype=field_dtype, buffer=buffer, offset=offset))
+    
+    def grow(self, n_new: int):
+        """
+        Append n_new default rows, copying the arrays into a new buffer
+        
+        A shared store moves to a new block (the old one is unlinked), so
+        attached processes must attach again with the new spec().
+        """
+        n_old = self.n_nodes
+        old_arrays = {name: getattr(self, name) for name in self._field_names()}
+        old_segment = self.segment
+        
+        self.n_nodes = n_old + n_new
+        layout, self.nbytes = self.layout(self.n_nodes, self.state_dim, self.dtype)
+        if old_segment is not None:
+            self.segment = shared_memory.SharedMemory(create=True, size=max(1, self.nbytes))
+            buffer = self.segment.buf
+        else:
+            buffer = np.zeros(max(1, self.nbytes), dtype=np.uint8)
+        self._map(layout, buffer)
+        
+        for name, old in old_arrays.items():
+            getattr(self, name)[:n_old] = old
+        self.state[n_old:] = 0
+        self.load[n_old:] = 0.0
+        self.tasks_completed[n_old:] = 0
+        self.tasks_failed[n_old:] = 0
+        self.status[n_old:] = 0
+        self._fill_defaults(slice(n_old, None))
+        
+        if old_segment is not None:
+            del old_arrays, old
+            old_segment.unlink()
+            try:
+                old_segment.close()
+            except BufferError:
+                # Views of the old rows are still alive; the mapping goes
+                # away with them
+                pass
+    
+    @staticmethod
+    def _field_names() -> List[str]:
+        return ["state"] + [name for name, _, _ in STORE_FIELDS]
+    
+    def _set_status_names(self, names: List[str]):
+        self.status_names = list(names)
+        self._status_codes = {name: code for code, name in enumerate(self.status_names)}
+        self.operational_code = self._status_codes["OPERATIONAL"]
+    
+    def spec(self) -> Dict:
+        """Everything attach() needs to map a shared store in another process"""
+        if self.segment is None:
+            raise ValueError("Store is not in shared memory (create it with shared=True)")
+        return {
+            "name": self.segment.name,
+            "n_nodes": self.n_nodes,
+            "state_dim": self.state_dim,
+            "dtype": self.dtype.str,
+            "status_names": list(self.status_names)
+        }
+    
+    @classmethod
+    def attach(cls, spec: Dict) -> "SubNodeStore":
+        """Map a store published by another process through spec()"""
+        store = cls.__new__(cls)
+        store.n_nodes = spec["n_nodes"]
+        store.state_dim = spec["state_dim"]
+        store.dtype = np.dtype(spec["dtype"])
+        
+        layout, store.nbytes = cls.layout(store.n_nodes, store.state_dim, store.dtype)
+        # The publishing process owns and unlinks the block
+        store.segment = shared_memory.SharedMemory(name=spec["name"])
+        store._owner = False
+        store._map(layout, store.segment.buf)
+        
+        store._set_status_names(spec["status_names"])
+        store.recount()
+        return store
+    
+    def close(self):
+        """Unmap a shared store; the owner also unlinks the block"""
+        if self.segment is None:
+            return
+        for name in self._field_names():
+            setattr(self, name, None)
+        self.segment.close()
+        if self._owner:
+            self.segment.unlink()
+        self.segment = None
+    
+    def recount(self):
+        """Recompute the running aggregates from the arrays"""
+        self.load_sum = float(np.sum(self.load))
+        self.load_sq_sum = float(np.dot(self.load, self.load))
+        self.completed_sum = int(np.sum(self.tasks_completed))
+        self.failed_sum = int(np.sum(self.tasks_failed))
+        self.operational_count = int(np.count_nonzero(self.status == self.operational_code))
+    
+    def initialize_rows(self, rows: np.ndarray, rng: Optional[np.random.Generator] = None):
+        """
+        Bring rows up as fresh operational nodes
+        
+        Each row gets a random normalized state, a capacity in
+        [0.8, 1.0), zero load and a current heartbeat.
+        
+        Args:
+            rows: Rows to initialize
+            rng: Random generator (default: freshly seeded)
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        rows = np.asarray(rows, dtype=np.intp)
+        for start in range(0, len(rows), INIT_CHUNK_ROWS):
+            chunk = rows[start:start + INIT_CHUNK_ROWS]
+            shape = (len(chunk), self.state_dim)
+            state = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+            state /= np.linalg.norm(state, axis=1, keepdims=True)
+            self.state[chunk] = state
+        
+        self.capacity[rows] = rng.uniform(0.8, 1.0, len(rows))
+        self.load[rows] = 0.0
+        self.status[rows] = self.operational_code
+        self.last_heartbeat[rows] = time.time()
+        self.recount()
+    
+    def status_code(self, name: str) -> int:
+        """Code for a status name, registering new names"""
+        code = self._status_codes.get(name)
+        if code is None:
+            code = len(self.status_names)
+            self.status_names.append(name)
+            self._status_codes[name] = code
+        return code
+    
+    def set_status(self, row: int, name: str):
+        code = self.status_code(name)
+        self.operational_count += (
+            int(code == self.operational_code) - int(self.status[row] == self.operational_code)
+        )
+        self.status[row] = code
+    
+    def set_load(self, row: int, value: float):
+        old = self.load[row]
+        self.load_sum += value - old
+        self.load_sq_sum += value * value - old * old
+        self.load[row] = value
+    
+    def add_completed(self, rows, counts=1):
+        """Add completed tasks for one row or an array of rows"""
+        self.completed_sum += self._add(self.tasks_completed, rows, counts)
+    
+    def add_failed(self, rows, counts=1):
+        """Add failed tasks for one row or an array of rows"""
+        self.failed_sum += self._add(self.tasks_failed, rows, counts)
+    
+    @staticmethod
+    def _add(counter: np.ndarray, rows, counts) -> int:
+        if np.ndim(rows) == 0:
+            counter[rows] += counts
+            return int(counts)
+        counts = np.broadcast_to(counts, np.shape(rows))
+        np.add.at(counter, rows, counts)
+        return int(np.sum(counts))
+    
+    def decay_loads(self, amount: float):
+        """Lower every load by amount (floored at 0) and re-total exactly"""
+        np.maximum(self.load - amount, 0.0, out=self.load)
+        self.load_sum = float(np.sum(self.load))
+        self.load_sq_sum = float(np.dot(self.load, self.load))
+    
+    def load_std(self, count: Optional[int] = None) -> float:
+        """
+        Population standard deviation of load from the running sums
+        
+        Args:
+            count: Nodes the loads are spread over (default: every row;
+                rows with zero load, such as removed ones, can be left out)
+        """
+        count = self.n_nodes if count is None else count
+        if count == 0:
+            return 0.0
+        mean = self.load_sum / count
+        return float(np.sqrt(max(0.0, self.load_sq_sum / count - mean * mean)))
 
 
 class QuantumSubNode:
-    """Individual quantum sub-node with processing capabilities"""
+    """
+    Individual quantum sub-node with processing capabilities
     
-    def __init__(self, node_id: int, n_qubits: int = 6):
-        self.node_id = node_id
-        self.n_qubits = n_qubits
+    A thin view over one row of a SubNodeStore: state, load, capacity,
+    status and counters all live in the store, so a cluster of nodes
+    costs little more than its arrays.
+    """
+    
+    __slots__ = (
+        "_store", "_row", "_rng", "_seed_root", "load_listener", "worker",
+        "node_id", "n_qubits", "plan", "uptime"
+    )
+    
+    def __init__(self, node_id: int, n_qubits: int = 6, precision: str = "double",
+                 store: Optional[SubNodeStore] = None, row: int = 0, seed=None):
+        # A standalone node gets a single-row store of its own
+        if store is None:
+            store = SubNodeStore(1, 2 ** n_qubits, PRECISIONS[precision])
+        self._bind(store, row, node_id)
+        self._rng = np.random.default_rng(seed)
         self.status = "INITIALIZING"
         
         # Node state
         self.quantum_state = self._initialize_quantum_state()
-        self.processing_capacity = np.random.uniform(0.8, 1.0)
+        self.processing_capacity = self.rng.uniform(0.8, 1.0)
         self.load = 0.0
-        self.uptime = 0.0
-        
-        # Redundancy tracking
-        self.backup_nodes = []
-        self.primary_node = None
-        
-        # Performance metrics
-        self.tasks_completed = 0
-        self.tasks_failed = 0
-        self.last_heartbeat = datetime.now(timezone.utc)
         
         # Set operational
         self.status = "OPERATIONAL"
+    
+    @classmethod
+    def from_store(cls, store: SubNodeStore, row: int, node_id: Optional[int] = None,
+                   seed_root: Optional[np.random.SeedSequence] = None) -> "QuantumSubNode":
+        """
+        View an already initialized store row as a node
+        
+        Args:
+            store: Store holding the node's row
+            row: Row index
+            node_id: Node id (default: the row index)
+            seed_root: Cluster seed; the node's stream is its child for this row
+        """
+        node = cls.__new__(cls)
+        node._bind(store, row, row if node_id is None else node_id)
+        node._seed_root = seed_root
+        return node
+    
+    def _bind(self, store: SubNodeStore, row: int, node_id: int):
+        self._store = store
+        self._row = row
+        
+        # Noise stream, created on first use (a Generator costs ~1 KB)
+        self._rng = None
+        self._seed_root = None
+        
+        # Called with no arguments whenever load or status changes
+        self.load_listener = None
+        
+        # NodeWorker when the cluster runs in concurrent mode
+        self.worker = None
+        
+        self.node_id = node_id
+        self.n_qubits = int(store.state_dim).bit_length() - 1
+        self.uptime = 0.0
+        
+        # Shared readout plan for this qubit count
+        self.plan = compile_circuit(self.n_qubits, 0)
+    
+    @property
+    def rng(self) -> np.random.Generator:
+        """This node's own random stream"""
+        if self._rng is None:
+            seed = None
+            if self._seed_root is not None:
+                # Same stream as child `row` of seed_root.spawn()
+                root = self._seed_root
+                seed = np.random.SeedSequence(
+                    root.entropy, spawn_key=root.spawn_key + (self._row,),
+                    pool_size=root.pool_size
+                )
+            self._rng = np.random.default_rng(seed)
+        return self._rng
+    
+    @property
+    def dtype(self) -> np.dtype:
+        return self._store.dtype
+    
+    @property
+    def quantum_state(self) -> np.ndarray:
+        return self._store.state[self._row]
+    
+    @quantum_state.setter
+    def quantum_state(self, value: np.ndarray):
+        self._store.state[self._row] = value
+    
+    @property
+    def load(self) -> float:
+        return float(self._store.load[self._row])
+    
+    @load.setter
+    def load(self, value: float):
+        self._store.set_load(self._row, value)
+        if self.load_listener is not None:
+            self.load_listener()
+    
+    @property
+    def status(self) -> str:
+        return self._store.status_names[self._store.status[self._row]]
+    
+    @status.setter
+    def status(self, value: str):
+        self._store.set_status(self._row, value)
+        if self.load_listener is not None:
+            self.load_listener()
+    
+    @property
+    def processing_capacity(self) -> float:
+        return float(self._store.capacity[self._row])
+    
+    @processing_capacity.setter
+    def processing_capacity(self, value: float):
+        self._store.capacity[self._row] = value
+    
+    @property
+    def tasks_completed(self) -> int:
+        return int(self._store.tasks_completed[self._row])
+    
+    @tasks_completed.setter
+    def tasks_completed(self, value: int):
+        self._store.add_completed(self._row, value - self.tasks_completed)
+    
+    @property
+    def tasks_failed(self) -> int:
+        return int(self._store.tasks_failed[self._row])
+    
+    @tasks_failed.setter
+    def tasks_failed(self, value: int):
+        self._store.add_failed(self._row, value - self.tasks_failed)
+    
+    @property
+    def backup_nodes(self) -> Tuple[int, ...]:
+        """
+        Redundancy tracking: ids of the nodes that take over on failure
         
+        Read from the store's two backup slots on each access. The tuple
+        is immutable; change backups by assigning a new sequence.
+        """
+        return tuple(backup for backup in self._store.backup_nodes[self._row].tolist() if backup >= 0)
+    
+    @backup_nodes.setter
+    def backup_nodes(self, value: List[int]):
+        backups = list(value)
+        if len(backups) > 2:
+            raise ValueError(f"A node has at most 2 backups, got {len(backups)}")
+        self._store.backup_nodes[self._row] = backups + [-1] * (2 - len(backups))
+    
+    @property
+    def primary_node(self) -> Optional[int]:
+        primary = int(self._store.primary_node[self._row])
+        return primary if primary >= 0 else None
+    
+    @primary_node.setter
+    def primary_node(self, value: Optional[int]):
+        self._store.primary_node[self._row] = -1 if value is None else value
+    
+    @property
+    def last_heartbeat(self) -> datetime:
+        return datetime.fromtimestamp(self._store.last_heartbeat[self._row], timezone.utc)
+    
+    @last_heartbeat.setter
+    def last_heartbeat(self, value: datetime):
+        self._store.last_heartbeat[self._row] = value.timestamp()
+    
     def _initialize_quantum_state(self) -> np.ndarray:
         """Initialize quantum state for the node"""
         state_dim = 2 ** self.n_qubits
-        state = np.random.randn(state_dim) + 1j * np.random.randn(state_dim)
+        state = self.rng.standard_normal(state_dim) + 1j * self.rng.standard_normal(state_dim)
         # Normalize to unit vector
         state = state / np.linalg.norm(state)
-        return state
+        return state.astype(self.dtype)
     
     def process_task(self, task_data: np.ndarray) -> Dict:
         """
@@ -74,9 +512,11 @@ class QuantumSubNode:
             # Measure result
             result = self._measure_state(processed_state)
             
-            # Update metrics
-            self.tasks_completed += 1
-            self.load = min(1.0, self.load + 0.1)
+            # Update metrics (a worker accounts load from its queue instead)
+            with self._counter_lock():
+                self._store.add_completed(self._row)
+            if self.worker is None:
+                self.load = min(1.0, self.load + 0.1)
             
             processing_time = time.time() - start_time
             
@@ -89,7 +529,8 @@ class QuantumSubNode:
             }
             
         except Exception as e:
-            self.tasks_failed += 1
+            with self._counter_lock():
+                self._store.add_failed(self._row)
             return {
                 "status": "FAILED",
                 "node_id": self.node_id,
@@ -97,17 +538,21 @@ class QuantumSubNode:
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
     
+    def _counter_lock(self):
+        # Worker threads share the store's running totals
+        return self.worker.lock if self.worker is not None else nullcontext()
+    
     def _encode_task(self, task_data: np.ndarray) -> np.ndarray:
         """Encode classical task data into quantum state"""
         # Pad or truncate to match quantum state dimension
         state_dim = 2 ** self.n_qubits
         
         if len(task_data) < state_dim:
-            padded = np.zeros(state_dim, dtype=complex)
+            padded = np.zeros(state_dim, dtype=self.dtype)
             padded[:len(task_data)] = task_data
             encoded = padded
         else:
-            encoded = task_data[:state_dim].astype(complex)
+            encoded = task_data[:state_dim].astype(self.dtype)
         
         # Normalize
         norm = np.linalg.norm(encoded)
@@ -124,9 +569,9 @@ class QuantumSubNode:
         processed = self.quantum_state * state
         
         # Apply quantum noise
-        noise = (np.random.randn(len(state)) + 
-                1j * np.random.randn(len(state))) * 0.01
-        processed = processed + noise
+        noise = (self.rng.standard_normal(len(state)) +
+                1j * self.rng.standard_normal(len(state))) * 0.01
+        processed = processed + noise.astype(self.dtype)
         
         # Renormalize
         processed = processed / np.linalg.norm(processed)
@@ -136,16 +581,16 @@ class QuantumSubNode:
     def _measure_state(self, state: np.ndarray) -> float:
         """Measure quantum state to get classical result"""
         probabilities = np.abs(state) ** 2
-        expectation = np.sum(probabilities * np.arange(len(probabilities)))
-        # Normalize to 0-1 range
-        return expectation / (len(probabilities) - 1)
+        # Expectation of the basis index, normalized to 0-1 range
+        return probabilities @ self.plan.readout_for(probabilities.dtype)
     
     def heartbeat(self) -> Dict:
         """Generate heartbeat status"""
         self.last_heartbeat = datetime.now(timezone.utc)
         
-        # Decay load over time
-        self.load = max(0.0, self.load - 0.05)
+        # Decay load over time (a worker reports its real queue occupancy)
+        if self.worker is None:
+            self.load = max(0.0, self.load - HEARTBEAT_DECAY)
         
         return {
             "node_id": self.node_id,
@@ -167,49 +612,511 @@ class QuantumSubNode:
         return signature[:12]
 
 
+class NodeWorker:
+    """
+    Worker thread with a bounded task queue backing one sub-node
+    
+    The node's load is the fraction of the queue in use (queued plus
+    running tasks over queue_depth), updated under the cluster lock as
+    tasks enter and leave. NumPy releases the GIL inside the array
+    kernels, so nodes make progress in parallel.
+    """
+    
+    def __init__(self, node: "QuantumSubNode", queue_depth: int,
+                 lock: threading.Condition):
+        self.node = node
+        self.queue_depth = queue_depth
+        self.lock = lock
+        self.in_flight = 0
+        
+        self.tasks = queue.Queue(maxsize=queue_depth)
+        self.thread = threading.Thread(
+            target=self._run, name=f"subnode-{node.node_id}", daemon=True
+        )
+        node.worker = self
+        self.thread.start()
+    
+    def submit(self, task_data: np.ndarray) -> Future:
+        """Queue a task; must be called with the cluster lock held"""
+        future = Future()
+        self.enqueue((task_data, future, time.time()))
+        return future
+    
+    def enqueue(self, item: Tuple):
+        """Queue a (task_data, future, queued_at) item; cluster lock held"""
+        self.tasks.put_nowait(item)
+        self.in_flight += 1
+        self.node.load = self.in_flight / self.queue_depth
+    
+    def take_queued(self) -> List[Tuple]:
+        """Remove the tasks not started yet; cluster lock held"""
+        items = []
+        while True:
+            try:
+                item = self.tasks.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # Stop sentinel stays last
+                self.tasks.put_nowait(None)
+                break
+            items.append(item)
+        
+        self.in_flight -= len(items)
+        self.node.load = self.in_flight / self.queue_depth
+        return items
+    
+    def _run(self):
+        while True:
+            item = self.tasks.get()
+            if item is None:
+                break
+            
+            task_data, future, queued_at = item
+            try:
+                # Tasks cancelled after a timeout are dropped unprocessed
+                if future.set_running_or_notify_cancel():
+                    start_time = time.time()
+                    try:
+                        result = self.node.process_task(task_data)
+                        result["queue_time"] = start_time - queued_at
+                        future.set_result(result)
+                    except Exception as e:
+                        future.set_exception(e)
+            finally:
+                with self.lock:
+                    self.in_flight -= 1
+                    self.node.load = self.in_flight / self.queue_depth
+                    self.lock.notify_all()
+    
+    def stop(self):
+        """Finish queued tasks and end the thread"""
+        self.tasks.put(None)
+        self.thread.join()
+        self.node.worker = None
+
+
+# Load added per task and its cap (see QuantumSubNode.process_task)
+TASK_LOAD = 0.1
+MAX_LOAD = 1.0
+
+# Assignment slots considered per node by the batch engine: enough for
+# any starting load to reach MAX_LOAD in TASK_LOAD steps
+SLOTS_PER_NODE = 12
+
+# Fewest nodes left taking tasks after a drain or removal, so every node
+# keeps two distinct backups
+MIN_ACTIVE_NODES = 3
+
+# Python-side bytes per node outside the store, rounded up from about 800
+# measured: the node view, its backup list, its load listener and the
+# scheduler's heap entry
+NODE_OVERHEAD_BYTES = 1024
+
+
 class QuantumSubNodeCluster:
     """
     Manages cluster of 24 quantum sub-nodes
     Provides redundancy, load balancing, and failover
     """
     
-    def __init__(self, n_nodes: int = 24, qubits_per_node: int = 6):
+    def __init__(self, n_nodes: int = 24, qubits_per_node: int = 6,
+                 precision: str = "double", scheduler="least_loaded",
+                 memory_budget: Optional[int] = None, shared: bool = False,
+                 seed=None):
         self.n_nodes = n_nodes
         self.qubits_per_node = qubits_per_node
+        self.precision = precision
+        
+        self.memory_budget = memory_budget
+        self._check_memory_budget(n_nodes)
         
-        # Initialize all nodes
+        # Independent random streams: node initialization, per-node noise,
+        # batch engine noise and scheduler sampling
+        init_seed, self.node_seed, batch_seed, self.scheduler_seed = spawn_seeds(seed, 4)
+        self.init_rng = np.random.default_rng(init_seed)
+        self.rng = np.random.default_rng(batch_seed)
+        
+        # All node data lives in one store (optionally in shared memory);
+        # nodes are thin views of its rows
+        self.store = SubNodeStore(n_nodes, 2 ** qubits_per_node, PRECISIONS[precision],
+                                  shared=shared)
+        self.store.initialize_rows(np.arange(n_nodes), self.init_rng)
         self.nodes = [
-            QuantumSubNode(node_id=i, n_qubits=qubits_per_node)
+            QuantumSubNode.from_store(self.store, i, seed_root=self.node_seed)
             for i in range(n_nodes)
         ]
         
         # Setup redundancy groups
         self._setup_redundancy()
         
+        # Node selection policy (see quantum_scheduler)
+        self.set_scheduler(scheduler)
+        
         # Cluster metrics
         self.cluster_metrics = {
             "total_tasks": 0,
             "successful_tasks": 0,
             "failed_tasks": 0,
-            "failovers": 0
+            "failovers": 0,
+            "timeouts": 0,
+            "rejected_tasks": 0,
+            "deadline_misses": 0
         }
+        # Caller, worker, executor and event loop threads all count here
+        self._metrics_lock = threading.Lock()
+        
+        # Concurrent mode (see start_workers)
+        self.workers = None
+        self._async_executor = None
+        self._lock = None
+        self.queue_depth = None
+        self.task_timeout = None
+        self.backpressure_timeout = None
         
         self.start_time = datetime.now(timezone.utc)
+    
+    def __getstate__(self) -> Dict:
+        # Locks do not copy; a copied cluster gets a fresh metrics lock
+        state = self.__dict__.copy()
+        del state["_metrics_lock"]
+        return state
+    
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._metrics_lock = threading.Lock()
         
+    @property
+    def state_matrix(self) -> np.ndarray:
+        """Node states, one row per node"""
+        return self.store.state
+    
+    @staticmethod
+    def estimate_memory(n_nodes: int, qubits_per_node: int = 6,
+                        precision: str = "double") -> int:
+        """Approximate bytes held by a cluster: its store plus per-node objects"""
+        _, store_bytes = SubNodeStore.layout(n_nodes, 2 ** qubits_per_node, PRECISIONS[precision])
+        return store_bytes + n_nodes * NODE_OVERHEAD_BYTES
+    
+    def _check_memory_budget(self, n_rows: int):
+        if self.memory_budget is None:
+            return
+        required = self.estimate_memory(n_rows, self.qubits_per_node, self.precision)
+        if required > self.memory_budget:
+            raise ValueError(
+                f"{n_rows} nodes of {self.qubits_per_node} qubits need about {required} bytes, "
+                f"over the memory budget of {self.memory_budget}"
+            )
+    
     def _setup_redundancy(self):
         """
         Setup redundancy groups for nodes
         Each node has 2 backup nodes
+        
+        Backups sit a third and two thirds of the way around the ring of
+        nodes still in the cluster (in id order). Computed on the store
+        arrays, so rerunning it after a membership change is cheap.
         """
-        n = self.n_nodes
+        store = self.store
+        members = store.status != store.status_code("REMOVED")
+        ring = np.flatnonzero(members)
+        n = len(ring)
+        position = np.arange(n)
         
-        for i, node in enumerate(self.nodes):
-            # Assign backup nodes in circular fashion
-            backup1_id = (i + n // 3) % n
-            backup2_id = (i + 2 * n // 3) % n
+        store.backup_nodes[~members] = -1
+        store.primary_node[~members] = -1
+        
+        # Assign backup nodes in circular fashion
+        store.backup_nodes[ring, 0] = ring[(position + n // 3) % n]
+        store.backup_nodes[ring, 1] = ring[(position + 2 * n // 3) % n]
+        store.primary_node[ring] = ring[(position - n // 3) % n]
+    
+    def _membership_lock(self):
+        """Cluster lock in worker mode, else a no-op context"""
+        return self._lock if self._lock is not None else nullcontext()
+    
+    def _check_active_floor(self, leaving: List[int]):
+        store = self.store
+        excluded = np.isin(store.status, [store.status_code(name) for name in EXCLUDED_STATUSES])
+        staying = int(np.count_nonzero(~excluded)) - sum(
+            1 for node_id in set(leaving) if not excluded[node_id]
+        )
+        if staying < MIN_ACTIVE_NODES:
+            raise ValueError(
+                f"At least {MIN_ACTIVE_NODES} nodes must keep taking tasks, {staying} would remain"
+            )
+    
+    def _node(self, node_id: int) -> QuantumSubNode:
+        """Node still in the cluster by id"""
+        if not 0 <= node_id < len(self.nodes) or self.nodes[node_id].status == "REMOVED":
+            raise ValueError(f"Node {node_id} is not in the cluster")
+        return self.nodes[node_id]
+    
+    def add_nodes(self, count: int) -> List[int]:
+        """
+        Grow the cluster by count fresh operational nodes
+        
+        New nodes get the next ids, join the scheduler (and get workers in
+        concurrent mode) and the backup ring is recomputed.
+        
+        Args:
+            count: Nodes to add
+        
+        Returns:
+            Ids of the new nodes
+        
+        Raises:
+            ValueError: If count is not positive or the memory budget
+                would be exceeded
+        """
+        if count < 1:
+            raise ValueError(f"count must be positive, got {count}")
+        start = self.store.n_nodes
+        self._check_memory_budget(start + count)
+        
+        with self._membership_lock():
+            self.store.grow(count)
+            rows = np.arange(start, start + count)
+            self.store.initialize_rows(rows, self.init_rng)
+            
+            for row in rows.tolist():
+                node = QuantumSubNode.from_store(self.store, row, seed_root=self.node_seed)
+                self.nodes.append(node)
+                self.scheduler.add_node(row)
+                if self.workers is not None:
+                    self.workers.append(NodeWorker(node, self.queue_depth, self._lock))
             
-            node.backup_nodes = [backup1_id, backup2_id]
-            node.primary_node = (i - n // 3) % n
+            self.n_nodes += count
+            self._setup_redundancy()
+        
+        return rows.tolist()
+    
+    def _migrate_queued(self, node: QuantumSubNode) -> int:
+        """
+        Move a worker's unstarted tasks to other nodes; cluster lock held
+        
+        Each task goes to the scheduled node, else to a backup with queue
+        room, else back to the node itself. Callers keep their futures.
+        """
+        migrated = 0
+        for item in node.worker.take_queued():
+            candidates = [self.nodes[self.scheduler.select()]]
+            candidates += [self.nodes[backup] for backup in node.backup_nodes]
+            target = next(
+                (
+                    candidate for candidate in candidates
+                    if candidate is not node and candidate.worker is not None
+                    and candidate.status == "OPERATIONAL" and not candidate.worker.tasks.full()
+                ),
+                node
+            )
+            target.worker.enqueue(item)
+            migrated += target is not node
+        return migrated
+    
+    def drain_node(self, node_id: int) -> Dict:
+        """
+        Stop scheduling onto a node and move its queued tasks elsewhere
+        
+        The node finishes the task it is running. Setting its status back
+        to OPERATIONAL returns it to service.
+        
+        Args:
+            node_id: Node to drain
+        
+        Returns:
+            Node id, status and number of migrated tasks
+        """
+        node = self._node(node_id)
+        self._check_active_floor([node_id])
+        
+        with self._membership_lock():
+            node.status = "DRAINING"
+            migrated = self._migrate_queued(node) if node.worker is not None else 0
+        
+        return {
+            "node_id": node_id,
+            "status": node.status,
+            "migrated_tasks": migrated,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
+    def remove_nodes(self, node_ids: List[int]) -> Dict:
+        """
+        Drain nodes and take them out of the cluster
+        
+        Removed nodes keep their id and store row (status REMOVED) so ids
+        stay stable; they are never scheduled and leave the backup ring,
+        which is recomputed over the remaining nodes.
+        
+        Args:
+            node_ids: Nodes to remove
+        
+        Returns:
+            Removed ids, migrated task count and the new cluster size
+        
+        Raises:
+            ValueError: For unknown ids or if fewer than MIN_ACTIVE_NODES
+                would keep taking tasks
+        """
+        node_ids = list(dict.fromkeys(node_ids))
+        nodes = [self._node(node_id) for node_id in node_ids]
+        self._check_active_floor(node_ids)
+        
+        migrated = 0
+        for node in nodes:
+            if node.status != "DRAINING":
+                migrated += self.drain_node(node.node_id)["migrated_tasks"]
+        
+        # Workers finish their running task; joined outside the lock
+        for node in nodes:
+            worker = node.worker
+            if worker is not None:
+                worker.stop()
+                self.workers.remove(worker)
+        
+        with self._membership_lock():
+            for node in nodes:
+                node.status = "REMOVED"
+                node.load = 0.0
+                self.scheduler.remove_node(node.node_id)
+            
+            self.n_nodes -= len(nodes)
+            self._setup_redundancy()
+        
+        return {
+            "removed": node_ids,
+            "migrated_tasks": migrated,
+            "n_nodes": self.n_nodes,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
+    def set_scheduler(self, scheduler):
+        """
+        Switch the node selection policy
+        
+        Args:
+            scheduler: "least_loaded", "power_of_two", "weighted_round_robin"
+                or a NodeScheduler class or instance
+        """
+        self.scheduler = make_scheduler(scheduler, self.nodes, seed=self.scheduler_seed.spawn(1)[0])
+        self.scheduler.store = self.store
+    
+    def start_workers(self, queue_depth: int = 8, task_timeout: float = 1.0,
+                      backpressure_timeout: float = 5.0):
+        """
+        Run every node on its own worker thread
+        
+        Args:
+            queue_depth: Bounded queue size per node; load becomes the
+                fraction of it in use
+            task_timeout: Seconds to wait for a node before failing over
+            backpressure_timeout: Seconds submit_task waits for capacity
+                when every node is above the availability threshold
+        """
+        if self.workers is not None:
+            return
+        
+        self._lock = threading.Condition()
+        self.queue_depth = queue_depth
+        self.task_timeout = task_timeout
+        self.backpressure_timeout = backpressure_timeout
+        with self._lock:
+            self.workers = [
+                NodeWorker(node, queue_depth, self._lock)
+                for node in self.nodes if node.status != "REMOVED"
+            ]
+    
+    def stop_workers(self):
+        """Drain worker queues and return to sequential execution"""
+        if self.workers is None:
+            return
+        
+        for worker in self.workers:
+            worker.stop()
+        self.workers = None
+        self._lock = None
+    
+    def close(self):
+        """Stop workers and the asyncio executor thread, releasing shared memory"""
+        self.stop_workers()
+        if self._async_executor is not None:
+            self._async_executor.shutdown()
+            self._async_executor = None
+        self.store.close()
+    
+    def submit_task(self, task_data: np.ndarray,
+                    node_index: Optional[int] = None) -> Tuple[int, Future]:
+        """
+        Queue a task on the scheduled node (concurrent mode)
+        
+        Blocks while every node is above the availability threshold,
+        up to backpressure_timeout.
+        
+        Args:
+            task_data: Task data for processing
+            node_index: Force a specific node instead of scheduling
+        
+        Returns:
+            Node index and the future of its result
+        
+        Raises:
+            TimeoutError: If no capacity frees up in time
+        """
+        deadline = time.monotonic() + self.backpressure_timeout
+        with self._lock:
+            while True:
+                if node_index is None:
+                    index = self.scheduler.select()
+                    if not self._can_take(self.nodes[index]):
+                        # A sampled pick can miss while other nodes are idle
+                        index = self._open_node()
+                    if index is not None:
+                        return index, self.nodes[index].worker.submit(task_data)
+                elif not self.nodes[node_index].worker.tasks.full():
+                    return node_index, self.nodes[node_index].worker.submit(task_data)
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._count(rejected_tasks=1)
+                    raise TimeoutError("All sub-nodes are above the load threshold")
+                self._lock.wait(remaining)
+    
+    def _can_take(self, node: "QuantumSubNode") -> bool:
+        return (node.worker is not None and self.scheduler.is_available(node) and
+                not node.worker.tasks.full())
+    
+    def _open_node(self) -> Optional[int]:
+        """Best node by scheduler key that can take a task now, if any"""
+        open_nodes = [index for index, node in enumerate(self.nodes) if self._can_take(node)]
+        return min(open_nodes, key=self.scheduler.node_key, default=None)
+    
+    def _await_result(self, node_index: int, future: Future,
+                      task_data: np.ndarray) -> Dict:
+        """Wait for a queued task, failing over when the node fails or times out"""
+        try:
+            result = future.result(timeout=self.task_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._count(timeouts=1)
+            return self._failover_task(node_index, task_data)
+        
+        # If primary failed, try backup
+        if result["status"] == "FAILED":
+            return self._failover_task(node_index, task_data)
+        return result
+    
+    def _count(self, **increments: int):
+        """Add to cluster_metrics counters under the metrics lock"""
+        with self._metrics_lock:
+            for name, amount in increments.items():
+                self.cluster_metrics[name] += amount
+    
+    def _record_result(self, result: Dict):
+        if result["status"] == "SUCCESS":
+            self._count(total_tasks=1, successful_tasks=1)
+        else:
+            self._count(total_tasks=1, failed_tasks=1)
     
     def distribute_task(self, task_data: np.ndarray) -> Dict:
         """
@@ -221,21 +1128,32 @@ class QuantumSubNodeCluster:
         Returns:
             Processing result with redundancy info
         """
-        # Find node with lowest load
-        available_nodes = [
-            node for node in self.nodes
-            if node.status == "OPERATIONAL" and node.load < 0.9
-        ]
+        if self.workers is not None:
+            try:
+                node_index, future = self.submit_task(task_data)
+            except TimeoutError as e:
+                result = {
+                    "status": "FAILED",
+                    "error": str(e),
+                    "timestamp": datetime.now(timezone.utc).isoformat()
+                }
+                self._record_result(result)
+                return result
+            result = self._await_result(node_index, future, task_data)
+            self._record_result(result)
+            return result
         
-        if not available_nodes:
-            # All nodes busy, use least loaded
-            node = min(self.nodes, key=lambda n: n.load)
-        else:
-            # Select based on load and capacity
-            node = min(
-                available_nodes,
-                key=lambda n: n.load / n.processing_capacity
-            )
+        result = self._distribute_sequential(task_data)
+        
+        # Update cluster metrics
+        self._record_result(result)
+        
+        return result
+    
+    def _distribute_sequential(self, task_data: np.ndarray) -> Dict:
+        """Sequential-mode distribute_task, without cluster metrics"""
+        # Lowest load / capacity among available nodes, else least loaded
+        node = self.nodes[self.scheduler.select()]
         
         # Process on primary node
         result = node.process_task(task_data)
@@ -244,13 +1162,6 @@ class QuantumSubNodeCluster:
         if result["status"] == "FAILED":
             result = self._failover_task(node.node_id, task_data)
         
-        # Update cluster metrics
-        self.cluster_metrics["total_tasks"] += 1
-        if result["status"] == "SUCCESS":
-            self.cluster_metrics["successful_tasks"] += 1
-        else:
-            self.cluster_metrics["failed_tasks"] += 1
-        
         return result
     
     def _failover_task(self, failed_node_id: int, task_data: np.ndarray) -> Dict:
@@ -271,14 +1182,27 @@ class QuantumSubNodeCluster:
             backup_node = self.nodes[backup_id]
             
             if backup_node.status == "OPERATIONAL" and backup_node.load < 0.95:
-                result = backup_node.process_task(task_data)
+                if self.workers is not None:
+                    # Bounded wait on the backup's queue as well
+                    try:
+                        _, future = self.submit_task(task_data, node_index=backup_id)
+                    except TimeoutError:
+                        continue
+                    try:
+                        result = future.result(timeout=self.task_timeout)
+                    except FutureTimeoutError:
+                        future.cancel()
+                        self._count(timeouts=1)
+                        continue
+                else:
+                    result = backup_node.process_task(task_data)
                 
                 if result["status"] == "SUCCESS":
                     result["failover"] = True
                     result["failed_node"] = failed_node_id
                     result["backup_node"] = backup_id
                     
-                    self.cluster_metrics["failovers"] += 1
+                    self._count(failovers=1)
                     
                     return result
         
@@ -290,28 +1214,396 @@ class QuantumSubNodeCluster:
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
+    def _assign_tasks(self, n_tasks: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Load-balance n_tasks in one step
+        
+        Gives the same assignment as calling distribute_task n_tasks times.
+        Each node's k-th task would be placed at the load it reaches after
+        k earlier tasks; those loads only grow, so the greedy choice is a
+        merge of every node's slots ordered by (unavailable, score, node id),
+        where the score is load / capacity for available nodes and the raw
+        load for the least-loaded fallback. Draining and removed nodes get
+        no slots. Once every node sits at MAX_LOAD the fallback keeps
+        picking the lowest remaining id.
+        
+        Other scheduling policies place tasks one by one through the
+        scheduler.
+        
+        Returns:
+            Node index per task, and each node's load after the batch
+        """
+        n_nodes = len(self.nodes)
+        if self.scheduler.policy != "least_loaded":
+            assignment = self.scheduler.assign(n_tasks, TASK_LOAD, MAX_LOAD)
+            return assignment, np.array([node.load for node in self.nodes])
+        
+        store = self.store
+        loads = store.load
+        capacity = store.capacity
+        operational = store.status == store.operational_code
+        excluded = np.isin(store.status, [store.status_code(name) for name in EXCLUDED_STATUSES])
+        
+        # Load before each slot, accumulated exactly as process_task does
+        steps = np.full((n_nodes, SLOTS_PER_NODE + 1), TASK_LOAD)
+        steps[:, 0] = loads
+        slot_loads = np.minimum(MAX_LOAD, np.cumsum(steps, axis=1))
+        
+        pending = slot_loads[:, :SLOTS_PER_NODE]
+        unavailable = ~(operational[:, np.newaxis] & (pending < AVAILABLE_LOAD))
+        score = np.where(unavailable, pending, pending / capacity[:, np.newaxis])
+        node_index = np.broadcast_to(np.arange(n_nodes)[:, np.newaxis], pending.shape)
+        
+        # Slots at MAX_LOAD repeat forever and are handled below
+        open_slots = (pending < MAX_LOAD) & ~excluded[:, np.newaxis]
+        order = np.lexsort((
+            node_index[open_slots], score[open_slots], unavailable[open_slots]
+        ))[:n_tasks]
+        
+        assignment = np.full(n_tasks, np.argmin(excluded), dtype=np.intp)
+        assignment[:len(order)] = node_index[open_slots][order]
+        
+        counts = np.bincount(assignment, minlength=n_nodes)
+        final_loads = slot_loads[np.arange(n_nodes), np.minimum(counts, SLOTS_PER_NODE)]
+        return assignment, final_loads
+    
+    def _encode_tasks(self, tasks) -> np.ndarray:
+        """Pad or truncate tasks to (n_tasks, 2^q) normalized states"""
+        state_dim = 2 ** self.qubits_per_node
+        dtype = self.state_matrix.dtype
+        
+        if isinstance(tasks, np.ndarray) and tasks.ndim == 2:
+            encoded = np.zeros((len(tasks), state_dim), dtype=dtype)
+            width = min(tasks.shape[1], state_dim)
+            encoded[:, :width] = tasks[:, :width]
+        else:
+            encoded = np.zeros((len(tasks), state_dim), dtype=dtype)
+            for i, task_data in enumerate(tasks):
+                row = np.ravel(task_data)[:state_dim]
+                encoded[i, :len(row)] = row
+        
+        norms = np.linalg.norm(encoded, axis=1)
+        empty = ~(norms > 0)
+        encoded[empty, 0] = 1.0
+        norms[empty] = 1.0
+        encoded /= norms[:, np.newaxis].astype(dtype)
+        return encoded
+    
+    def distribute_batch(self, tasks) -> Dict:
+        """
+        Load-balance and process a whole batch of tasks with matrix ops
+        
+        Equivalent to distribute_task per task: assignment is computed in
+        one vectorized step, then every task is encoded, combined with its
+        node's state row, perturbed and measured together.
+        
+        Args:
+            tasks: (n_tasks, n_features) matrix or list of task vectors
+        
+        Returns:
+            Columnar results: "node_id" and "result" arrays of shape
+            (n_tasks,), plus batch processing time and timestamp
+        """
+        start_time = time.time()
+        n_tasks = len(tasks)
+        
+        if self.workers is not None:
+            # Worker queues own the load accounting; gather their results
+            results = self._concurrent_batch(tasks)
+            return {
+                "node_id": np.array([r.get("node_id", -1) for r in results]),
+                "result": np.array([r.get("result", np.nan) for r in results]),
+                "processing_time": time.time() - start_time,
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+        
+        batch = self._process_batch(tasks)
+        self._record_batch(n_tasks)
+        return batch
+    
+    def _process_batch(self, tasks) -> Dict:
+        """Sequential-mode distribute_batch, without cluster metrics"""
+        start_time = time.time()
+        assignment, final_loads = self._assign_tasks(len(tasks))
+        
+        # Encode, process on the assigned node states, renormalize
+        task_states = self._encode_tasks(tasks)
+        processed = self.state_matrix[assignment] * task_states
+        noise = (self.rng.standard_normal(processed.shape) +
+                 1j * self.rng.standard_normal(processed.shape)) * 0.01
+        processed += noise.astype(processed.dtype)
+        processed /= np.linalg.norm(processed, axis=1, keepdims=True)
+        
+        # Measure expectation of the normalized basis index
+        probabilities = np.abs(processed) ** 2
+        plan = self.nodes[0].plan if self.nodes else compile_circuit(self.qubits_per_node, 0)
+        results = probabilities @ plan.readout_for(probabilities.dtype)
+        
+        # Update node counters
+        counts = np.bincount(assignment, minlength=len(self.nodes))
+        used = np.flatnonzero(counts)
+        self.store.add_completed(used, counts[used])
+        for row in used:
+            self.nodes[row].load = float(final_loads[row])
+        
+        return {
+            "node_id": np.array([node.node_id for node in self.nodes])[assignment],
+            "result": results.astype(np.float64),
+            "processing_time": time.time() - start_time,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
     def batch_process(self, tasks: List[np.ndarray]) -> List[Dict]:
         """Process batch of tasks with load balancing"""
-        results = []
+        if len(tasks) == 0:
+            return []
         
-        for task_data in tasks:
-            result = self.distribute_task(task_data)
-            results.append(result)
+        if self.workers is not None:
+            return self._concurrent_batch(tasks)
         
+        results = self._batch_results(tasks)
+        self._record_batch(len(results))
         return results
     
-    def get_cluster_health(self) -> Dict:
-        """Get comprehensive cluster health metrics"""
-        # Collect heartbeats
-        heartbeats = [node.heartbeat() for node in self.nodes]
+    def _batch_results(self, tasks) -> List[Dict]:
+        """Sequential-mode batch_process, without cluster metrics"""
+        batch = self._process_batch(tasks)
+        processing_time = batch["processing_time"] / len(tasks)
+        
+        return [
+            {
+                "status": "SUCCESS",
+                "node_id": int(node_id),
+                "result": float(result),
+                "processing_time": processing_time,
+                "timestamp": batch["timestamp"]
+            }
+            for node_id, result in zip(batch["node_id"], batch["result"])
+        ]
+    
+    def _record_batch(self, n_tasks: int):
+        self._count(total_tasks=n_tasks, successful_tasks=n_tasks)
+    
+    def _concurrent_batch(self, tasks) -> List[Dict]:
+        """Queue all tasks across the workers, then gather in order"""
+        results = [None] * len(tasks)
+        pending = []
+        
+        for i, task_data in enumerate(tasks):
+            try:
+                pending.append((i, task_data) + self.submit_task(task_data))
+            except TimeoutError as e:
+                results[i] = {
+                    "status": "FAILED",
+                    "error": str(e),
+                    "timestamp": datetime.now(timezone.utc).isoformat()
+                }
+                self._record_result(results[i])
+        
+        for i, task_data, node_index, future in pending:
+            results[i] = self._await_result(node_index, future, task_data)
+            self._record_result(results[i])
+        
+        return results
+    
+    def _get_async_executor(self) -> ThreadPoolExecutor:
+        # One thread keeps sequential-mode cluster state single-writer
+        if self._async_executor is None:
+            self._async_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="subnode-async"
+            )
+        return self._async_executor
+    
+    def _deadline_result(self) -> Dict:
+        self._count(deadline_misses=1)
+        return {
+            "status": "FAILED",
+            "error": "Deadline exceeded",
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
+    async def _distribute_on_workers(self, task_data: np.ndarray) -> Dict:
+        """Awaitable worker-mode distribute_task"""
+        loop = asyncio.get_running_loop()
+        try:
+            # Submission may block on backpressure, so it runs off the loop
+            node_index, future = await loop.run_in_executor(
+                self._get_async_executor(), self.submit_task, task_data
+            )
+        except TimeoutError as e:
+            result = {
+                "status": "FAILED",
+                "error": str(e),
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+            self._record_result(result)
+            return result
+        
+        try:
+            # Cancelling this await cancels the queued task as well
+            result = await asyncio.wait_for(asyncio.wrap_future(future), self.task_timeout)
+        except asyncio.TimeoutError:
+            self._count(timeouts=1)
+            result = None
+        
+        # Timed out or failed on the primary: try backups
+        if result is None or result["status"] == "FAILED":
+            result = await loop.run_in_executor(
+                self._get_async_executor(), self._failover_task, node_index, task_data
+            )
+        
+        self._record_result(result)
+        return result
+    
+    async def _run_before_deadline(self, work, record, timeout: Optional[float]):
+        """
+        Run work on the executor thread, recording it only if it beats the deadline
+        
+        The job and the deadline claim the outcome under a lock, so a task
+        is counted either as processed or as a deadline miss, never both.
+        A job that finishes after the deadline still updates its nodes.
+        
+        Args:
+            work: Callable producing the outcome
+            record: Callable updating cluster metrics from the outcome
+            timeout: Deadline in seconds (None waits indefinitely)
+        
+        Returns:
+            The outcome, or None when the deadline passed first
+        """
+        lock = threading.Lock()
+        claim = {"owner": None}
+        
+        def job():
+            with lock:
+                if claim["owner"] == "deadline":
+                    return None
+            outcome = work()
+            with lock:
+                if claim["owner"] is None:
+                    claim["owner"] = "job"
+                    record(outcome)
+            return outcome
+        
+        pending = asyncio.get_running_loop().run_in_executor(self._get_async_executor(), job)
+        try:
+            # Shielded so a missed deadline can still collect a recorded outcome
+            return await asyncio.wait_for(asyncio.shield(pending), timeout)
+        except asyncio.TimeoutError:
+            with lock:
+                if claim["owner"] is None:
+                    claim["owner"] = "deadline"
+            if claim["owner"] == "deadline":
+                pending.cancel()
+                return None
+            return await pending
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+    
+    async def distribute_task_async(self, task_data: np.ndarray,
+                                    timeout: Optional[float] = None) -> Dict:
+        """
+        Non-blocking distribute_task for asyncio callers
+        
+        Sequential mode runs distribute_task on the cluster's executor
+        thread; worker mode awaits the node's future directly. Cancelling
+        the coroutine drops the task if it has not started yet. A task that
+        misses the deadline counts as a deadline miss only, even if its
+        node finishes it later.
+        
+        Args:
+            task_data: Task data for processing
+            timeout: Deadline in seconds (None waits indefinitely)
+        
+        Returns:
+            Processing result, or a FAILED result when the deadline passes
+        """
+        if self.workers is not None:
+            try:
+                return await asyncio.wait_for(self._distribute_on_workers(task_data), timeout)
+            except asyncio.TimeoutError:
+                return self._deadline_result()
+        
+        result = await self._run_before_deadline(
+            lambda: self._distribute_sequential(task_data), self._record_result, timeout
+        )
+        return self._deadline_result() if result is None else result
+    
+    async def batch_process_async(self, tasks: List[np.ndarray],
+                                  timeout: Optional[float] = None) -> List[Dict]:
+        """
+        Non-blocking batch_process for asyncio callers
+        
+        Sequential mode runs the vectorized batch engine off the event
+        loop; worker mode awaits every task concurrently. Tasks not done
+        when the deadline passes come back as FAILED results.
+        
+        In worker mode each task meets or misses the deadline on its own.
+        Sequential mode computes the batch in one step, so the deadline
+        applies to the batch as a whole: either every task completes or
+        every task is a deadline miss.
+        
+        Args:
+            tasks: Task vectors
+            timeout: Deadline in seconds
+        
+        Returns:
+            Result per task, in order
+        """
+        if len(tasks) == 0:
+            return []
+        
+        if self.workers is not None:
+            pending = [
+                asyncio.ensure_future(self._distribute_on_workers(task_data))
+                for task_data in tasks
+            ]
+            done, not_done = await asyncio.wait(pending, timeout=timeout)
+            for task in not_done:
+                task.cancel()
+            return [
+                task.result() if task in done else self._deadline_result()
+                for task in pending
+            ]
         
-        # Calculate statistics
-        operational_nodes = sum(
-            1 for hb in heartbeats if hb["status"] == "OPERATIONAL"
+        results = await self._run_before_deadline(
+            lambda: self._batch_results(tasks),
+            lambda results: self._record_batch(len(results)),
+            timeout
         )
-        avg_load = np.mean([hb["load"] for hb in heartbeats])
-        total_completed = sum(hb["tasks_completed"] for hb in heartbeats)
-        total_failed = sum(hb["tasks_failed"] for hb in heartbeats)
+        if results is None:
+            return [self._deadline_result() for _ in tasks]
+        return results
+    
+    def heartbeat(self):
+        """
+        Cluster-wide heartbeat: stamp every node and decay loads at once
+        
+        Vectorized equivalent of calling heartbeat() on each node. Worker
+        mode reports queue occupancy as load, so loads are left as-is.
+        """
+        store = self.store
+        store.last_heartbeat[:] = time.time()
+        
+        if self.workers is None:
+            store.decay_loads(HEARTBEAT_DECAY)
+            self.scheduler.refresh()
+    
+    def get_cluster_health(self) -> Dict:
+        """
+        Get comprehensive cluster health metrics
+        
+        Read-only snapshot from the store's running aggregates: O(1) in
+        the number of nodes and does not touch node load.
+        """
+        store = self.store
+        operational_nodes = int(store.operational_count)
+        avg_load = store.load_sum / self.n_nodes if self.n_nodes else 0.0
+        total_completed = int(store.completed_sum)
+        total_failed = int(store.failed_sum)
+        with self._metrics_lock:
+            cluster_metrics = dict(self.cluster_metrics)
         
         uptime = (datetime.now(timezone.utc) - self.start_time).total_seconds()
         
@@ -325,20 +1617,37 @@ class QuantumSubNodeCluster:
             "total_tasks_failed": total_failed,
             "success_rate": float(total_completed / max(1, total_completed + total_failed)),
             "cluster_uptime": uptime,
-            "cluster_metrics": self.cluster_metrics,
+            "cluster_metrics": cluster_metrics,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
     def get_node_details(self) -> List[Dict]:
-        """Get detailed status of all nodes"""
+        """Get detailed status of all nodes in the cluster (read-only)"""
+        store = self.store
+        status_names = store.status_names
+        removed = store.status_code("REMOVED")
+        
         return [
             {
-                **node.heartbeat(),
+                "node_id": node.node_id,
+                "status": status_names[status],
+                "load": load,
+                "capacity": capacity,
+                "tasks_completed": completed,
+                "tasks_failed": failed,
+                "uptime": node.uptime,
+                "last_heartbeat": datetime.fromtimestamp(heartbeat, timezone.utc).isoformat(),
                 "signature": node.get_node_signature(),
-                "backup_nodes": node.backup_nodes,
-                "primary_node": node.primary_node
+                "backup_nodes": backups,
+                "primary_node": primary
             }
-            for node in self.nodes
+            for node, status, load, capacity, completed, failed, heartbeat, backups, primary in zip(
+                self.nodes, store.status.tolist(), store.load.tolist(),
+                store.capacity.tolist(), store.tasks_completed.tolist(),
+                store.tasks_failed.tolist(), store.last_heartbeat.tolist(),
+                store.backup_nodes.tolist(), store.primary_node.tolist()
+            )
+            if status != removed
         ]
     
     def redundancy_proof_check(self) -> Dict:
@@ -350,15 +1659,18 @@ class QuantumSubNodeCluster:
         - No single point of failure
         - Geographic distribution simulation
         """
+        store = self.store
+        members = store.status != store.status_code("REMOVED")
+        backups = store.backup_nodes[members]
+        
         checks = {
-            "backup_assignments": all(
-                len(node.backup_nodes) >= 2 for node in self.nodes
+            # Two backups per node, both still in the cluster
+            "backup_assignments": bool(
+                np.all(backups >= 0) and np.all(members[backups])
             ),
             "no_single_point_failure": True,  # By design with backups
-            "operational_capacity": len([
-                n for n in self.nodes if n.status == "OPERATIONAL"
-            ]) >= self.n_nodes * 0.75,
-            "load_distribution": np.std([n.load for n in self.nodes]) < 0.3
+            "operational_capacity": store.operational_count >= self.n_nodes * 0.75,
+            "load_distribution": store.load_std(self.n_nodes) < 0.3
         }
         
         all_passed = all(checks.values())
@@ -13,6 +13,7 @@ Manages:
 
 import sys
 import os
+import asyncio
 import json
 import time
 import signal
@@ -51,6 +52,13 @@ class Phase38Orchestrator:
         with open(config_path, 'r') as f:
             self.config = json.load(f)
         
+        # One root seed (config "seed", None for fresh entropy) for the
+        # actuary core, the sub-node cluster and synthetic market features
+        self.core_seed, self.cluster_seed, market_seed = np.random.SeedSequence(
+            self.config.get("seed")
+        ).spawn(3)
+        self.rng = np.random.default_rng(market_seed)
+        
         # Initialize components
         self.actuary_core = None
         self.subnode_cluster = None
@@ -91,10 +99,11 @@ class Phase38Orchestrator:
                 "care_loop_rate": self.config["components"]["faa_actuary_core"]["care_loop_rate"],
                 "brands_total": self.config["components"]["faa_actuary_core"]["brands_total"]
             },
-            "hotstack": self.config["components"]["hotstack_dashboard"]
+            "hotstack": self.config["components"]["hotstack_dashboard"],
+            "performance": self.config.get("performance", {})
         }
         
-        self.actuary_core = FAAActuaryQuantumCore(config=actuary_config)
+        self.actuary_core = FAAActuaryQuantumCore(config=actuary_config, seed=self.core_seed)
         
         # Initialize quantum model
         quantum_init = self.actuary_core.initialize_quantum_model()
@@ -113,7 +122,8 @@ class Phase38Orchestrator:
             
             self.subnode_cluster = QuantumSubNodeCluster(
                 n_nodes=cluster_config["n_nodes"],
-                qubits_per_node=cluster_config["qubits_per_node"]
+                qubits_per_node=cluster_config["qubits_per_node"],
+                seed=self.cluster_seed
             )
             print(f"   ✓ Cluster: {cluster_config['n_nodes']} nodes initialized")
             
@@ -136,47 +146,99 @@ class Phase38Orchestrator:
         
         try:
             # Generate random market features (40D)
-            market_features = np.random.randn(40)
+            market_features = self.rng.standard_normal(40)
             
             # Get integrated prediction from actuary core
             prediction = self.actuary_core.integrated_prediction(market_features)
             
             # Process through sub-node cluster if available
             if self.subnode_cluster is not None:
+                # One vectorized heartbeat per cycle decays node load
+                self.subnode_cluster.heartbeat()
+                
                 # Distribute prediction task to cluster
                 task_result = self.subnode_cluster.distribute_task(market_features[:10])
                 prediction["subnode_result"] = task_result
             
-            cycle_time = time.time() - cycle_start
+            return self._record_cycle(prediction, time.time() - cycle_start)
+            
+        except Exception as e:
+            return self._record_failed_cycle(e)
+    
+    async def run_prediction_cycle_async(self, subnode_timeout: Optional[float] = None) -> Dict:
+        """
+        Run one prediction cycle without blocking the event loop
+        
+        The sub-node task is started first and runs alongside the
+        integrated prediction (quantum ML and oracle consensus), which is
+        offloaded to the default executor.
+        
+        Args:
+            subnode_timeout: Deadline in seconds for the sub-node task
+        
+        Returns:
+            Cycle results with metrics
+        """
+        cycle_start = time.time()
+        loop = asyncio.get_running_loop()
+        subnode_task = None
+        
+        try:
+            # Generate random market features (40D)
+            market_features = self.rng.standard_normal(40)
             
-            # Update metrics
-            self.orchestration_metrics["total_cycles"] += 1
-            self.orchestration_metrics["successful_cycles"] += 1
-            self.orchestration_metrics["total_predictions"] += 1
+            if self.subnode_cluster is not None:
+                self.subnode_cluster.heartbeat()
+                subnode_task = asyncio.ensure_future(
+                    self.subnode_cluster.distribute_task_async(
+                        market_features[:10], timeout=subnode_timeout
+                    )
+                )
             
-            # Update average cycle time
-            n = self.orchestration_metrics["total_cycles"]
-            prev_avg = self.orchestration_metrics["average_cycle_time"]
-            self.orchestration_metrics["average_cycle_time"] = (
-                (prev_avg * (n - 1) + cycle_time) / n
+            prediction = await loop.run_in_executor(
+                None, self.actuary_core.integrated_prediction, market_features
             )
             
-            return {
-                "status": "SUCCESS",
-                "cycle_time": cycle_time,
-                "prediction": prediction,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
+            if subnode_task is not None:
+                prediction["subnode_result"] = await subnode_task
             
-        except Exception as e:
-            self.orchestration_metrics["total_cycles"] += 1
-            self.orchestration_metrics["failed_cycles"] += 1
+            return self._record_cycle(prediction, time.time() - cycle_start)
             
-            return {
-                "status": "FAILED",
-                "error": str(e),
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
+        except Exception as e:
+            if subnode_task is not None:
+                subnode_task.cancel()
+            return self._record_failed_cycle(e)
+    
+    def _record_cycle(self, prediction: Dict, cycle_time: float) -> Dict:
+        """Update metrics for a successful cycle"""
+        self.orchestration_metrics["total_cycles"] += 1
+        self.orchestration_metrics["successful_cycles"] += 1
+        self.orchestration_metrics["total_predictions"] += 1
+        
+        # Update average cycle time
+        n = self.orchestration_metrics["total_cycles"]
+        prev_avg = self.orchestration_metrics["average_cycle_time"]
+        self.orchestration_metrics["average_cycle_time"] = (
+            (prev_avg * (n - 1) + cycle_time) / n
+        )
+        
+        return {
+            "status": "SUCCESS",
+            "cycle_time": cycle_time,
+            "prediction": prediction,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+    
+    def _record_failed_cycle(self, error: Exception) -> Dict:
+        """Update metrics for a failed cycle"""
+        self.orchestration_metrics["total_cycles"] += 1
+        self.orchestration_metrics["failed_cycles"] += 1
+        
+        return {
+            "status": "FAILED",
+            "error": str(error),
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
     
     def get_system_health(self) -> Dict:
         """Get comprehensive system health status"""
@@ -263,6 +325,47 @@ class Phase38Orchestrator:
         finally:
             self.shutdown()
     
+    async def run_continuous_async(self, cycle_interval: Optional[float] = None):
+        """
+        Run continuous prediction cycles on the event loop
+        
+        Args:
+            cycle_interval: Seconds between cycle starts (default: from config)
+        """
+        if cycle_interval is None:
+            cycle_interval = self.config["components"]["oracle_feed"]["cycle_seconds"]
+        
+        self.running = True
+        cycle_count = 0
+        
+        print(f"\n🔄 Starting Continuous Operation (asyncio)")
+        print(f"   Cycle Interval: {cycle_interval}s")
+        
+        try:
+            while self.running:
+                cycle_count += 1
+                cycle_start = time.time()
+                
+                # Sub-node work gets the cycle interval as its deadline
+                result = await self.run_prediction_cycle_async(subnode_timeout=cycle_interval)
+                
+                if cycle_count % 10 == 0:
+                    print(f"Cycle {cycle_count}:")
+                    print(f"  Status: {result['status']}")
+                    print(f"  Cycle Time: {result.get('cycle_time', 0):.3f}s")
+                    
+                    if cycle_count % 50 == 0:
+                        self.export_dashboard_data()
+                        print(f"  Dashboard data exported")
+                
+                # Wait for next cycle
+                await asyncio.sleep(max(0.0, cycle_interval - (time.time() - cycle_start)))
+        
+        except asyncio.CancelledError:
+            print("\n⚠️  Cancelled")
+        finally:
+            self.shutdown()
+    
     def run_batch(self, n_cycles: int):
         """
         Run a fixed number of prediction cycles
@@ -310,6 +413,7 @@ class Phase38Orchestrator:
             cluster_state = self.subnode_cluster.export_cluster_state()
             with open("phase38_cluster_final_state.json", 'w') as f:
                 json.dump(cluster_state, f, indent=2)
+            self.subnode_cluster.close()
         
         # Export final dashboard data
         self.export_dashboard_data("phase38_final_dashboard.json")
@@ -340,7 +444,7 @@ def main():
     )
     parser.add_argument(
         '--mode',
-        choices=['continuous', 'batch', 'test'],
+        choices=['continuous', 'async', 'batch', 'test'],
         default='test',
         help='Operation mode'
     )
@@ -370,6 +474,11 @@ def main():
     # Run in selected mode
     if args.mode == 'continuous':
         orchestrator.run_continuous(cycle_interval=args.interval)
+    elif args.mode == 'async':
+        try:
+            asyncio.run(orchestrator.run_continuous_async(cycle_interval=args.interval))
+        except KeyboardInterrupt:
+            print("\n⚠️  Keyboard interrupt received")
     elif args.mode == 'batch':
         orchestrator.run_batch(n_cycles=args.cycles)
     else:  # test mode
@@ -12,17 +12,34 @@ lib_path = os.path.join(os.path.dirname(__file__), 'lib')
 if lib_path not in sys.path:
     sys.path.insert(0, lib_path)
 
+import asyncio
+import copy
+import json
+import threading
 import unittest
+from unittest import mock
+import tempfile
 import numpy as np
 
 # Import Phase 38 components
 from tensorflow_quantum_integration import (
     QuantumCircuitSimulator,
-    QuantumPredictiveModel
+    QuantumPredictiveModel,
+    OPTIMIZERS,
+    PredictionCache,
+    QuantumProcessPoolBackend,
+    compile_circuit,
+    make_optimizer
 )
-from oracle_feed_quantum import QuantumOracleFeed
-from quantum_subnodes import QuantumSubNode, QuantumSubNodeCluster
+from oracle_feed_quantum import (
+    BandedMatrix, QuantumOracleFeed, StreamingCorrelation, compare_entanglement_paths
+)
+from quantum_subnodes import QuantumSubNode, QuantumSubNodeCluster, SubNodeStore
+from quantum_scheduler import IndexedMinHeap, make_scheduler
 from faa_actuary_quantum_core import FAAActuaryQuantumCore
+from quantum_benchmark import (
+    BENCHMARK_FORMAT_VERSION, compare_to_baseline, run_benchmark
+)
 
 
 class TestQuantumCircuitSimulator(unittest.TestCase):
@@ -72,6 +89,94 @@ class TestQuantumCircuitSimulator(unittest.TestCase):
         total_prob = sum(measurement.values())
         self.assertAlmostEqual(total_prob, 1.0, places=5)
 
+    def test_vectorized_measurement(self):
+        """Test probability vector, expectation and sampled shots"""
+        state = self.simulator.encode_classical_data(np.random.randn(16))
+        
+        probabilities = self.simulator.probabilities(state)
+        self.assertAlmostEqual(np.sum(probabilities), 1.0, places=10)
+        
+        # Dict export carries the same distribution
+        measurement = self.simulator.measure(state)
+        for bitstring, prob in measurement.items():
+            self.assertAlmostEqual(probabilities[int(bitstring, 2)], prob, places=12)
+        
+        # Declared shot count is used by default
+        counts = self.simulator.sample_counts(probabilities)
+        self.assertEqual(counts.sum(), self.simulator.measurement_shots)
+        
+        exact = self.simulator.expectation_value(probabilities)
+        sampled = self.simulator.sampled_expectation(probabilities, shots=200000)
+        self.assertAlmostEqual(sampled, exact, places=2)
+    
+    def test_cnot_kernel(self):
+        """Test CNOT kernel against basis state permutation"""
+        for index in range(16):
+            state = np.zeros(16, dtype=complex)
+            state[index] = 1.0
+            
+            result = self.simulator._cnot(state, 1, 3)
+            
+            # Target bit flips only when control bit is set
+            expected = index ^ (1 << 3) if (index >> 1) & 1 else index
+            self.assertEqual(int(np.argmax(np.abs(result))), expected)
+    
+    def test_rotation_kernel(self):
+        """Test phase rotation only touches amplitudes with qubit set"""
+        state = np.ones(16, dtype=complex) / 4.0
+        
+        rotated = self.simulator._apply_rotation(state, 2, np.pi)
+        
+        mask = self.simulator._get_qubit_mask(2)
+        self.assertTrue(np.allclose(rotated[mask], -state[mask]))
+        self.assertTrue(np.allclose(rotated[~mask], state[~mask]))
+    
+    def test_compiled_circuit(self):
+        """Test fused circuit plan matches layer-by-layer gate application"""
+        # Plans are shared per circuit shape
+        self.assertIs(self.simulator.plan, compile_circuit(4, 10))
+        
+        state = self.simulator.encode_classical_data(np.random.randn(16))
+        circuit_params = np.random.randn(40)
+        
+        expected = state
+        for layer in range(self.simulator.circuit_depth):
+            layer_params = circuit_params[layer::self.simulator.circuit_depth]
+            tensor_state = expected.copy()
+            for qubit in range(4):
+                tensor_state = self.simulator._apply_rotation(
+                    tensor_state, qubit, layer_params[qubit]
+                )
+            expected = self.simulator._apply_entanglement(tensor_state)
+        
+        fused = self.simulator.plan.run(state, circuit_params)
+        self.assertTrue(np.allclose(fused, expected))
+    
+    
+    def test_simulate_pipeline(self):
+        """Test one-pass simulation returns consistent state and metrics"""
+        features = np.random.randn(3, 16)
+        circuit_params = np.random.randn(40)
+        
+        result = self.simulator.simulate(features, circuit_params)
+        
+        for i in range(3):
+            state = self.simulator.plan.run(
+                self.simulator.encode_classical_data(features[i]), circuit_params
+            )
+            self.assertTrue(np.allclose(result['state'][i], state))
+            self.assertAlmostEqual(
+                result['expectation'][i],
+                self.simulator.quantum_prediction(features[i], circuit_params)
+            )
+        
+        # Coherence is 1 - normalized entropy of the final distribution
+        self.assertTrue(np.allclose(result['coherence'], 1.0 - result['entropy'] / 4))
+        
+        # Bulk mode drops the per-row states
+        bulk = self.simulator.simulate(features, circuit_params, keep_state=False)
+        self.assertNotIn('state', bulk)
+        self.assertTrue(np.allclose(bulk['coherence'], result['coherence']))
 
 class TestQuantumPredictiveModel(unittest.TestCase):
     """Test quantum predictive model"""
@@ -79,6 +184,22 @@ class TestQuantumPredictiveModel(unittest.TestCase):
     def setUp(self):
         self.model = QuantumPredictiveModel(n_qubits=6, learning_rate=0.01)
     
+    def _mixing_readout(self, simulator):
+        """
+        Measure in the Hadamard basis instead of the computational one
+        
+        The circuit's phase gates and CNOT permutations leave basis
+        probabilities unchanged, so the default readout has a zero
+        gradient; mixing the amplitudes first makes it phase-sensitive.
+        """
+        hadamard = np.ones((1, 1))
+        for _ in range(simulator.n_qubits):
+            hadamard = np.kron(hadamard, [[1.0, 1.0], [1.0, -1.0]])
+        hadamard /= np.sqrt(len(hadamard))
+        return mock.patch.object(
+            simulator, 'probabilities', lambda state: np.abs(state @ hadamard) ** 2
+        )
+    
     def test_initialization(self):
         """Test model initialization"""
         self.assertEqual(self.model.quantum_circuit.n_qubits, 6)
@@ -115,6 +236,261 @@ class TestQuantumPredictiveModel(unittest.TestCase):
         # Check training history was updated
         self.assertEqual(len(self.model.training_history), initial_history_len + 1)
     
+    def test_parameter_shift_gradient(self):
+        """Test analytic gradient covers every parameter and matches finite differences"""
+        simulator = self.model.quantum_circuit
+        # Fixed inputs: small random angles can leave the gradient near zero
+        rng = np.random.default_rng(0)
+        features = rng.standard_normal(10)
+        params = rng.uniform(0, 2 * np.pi, self.model.n_params)
+        
+        with self._mixing_readout(simulator):
+            gradient = simulator.parameter_shift_gradient(features, params)
+            self.assertEqual(gradient.shape, (self.model.n_params,))
+            self.assertGreater(np.abs(gradient).max(), 1e-3)
+            
+            epsilon = 1e-5
+            for i in range(self.model.n_params):
+                shift = np.zeros_like(params)
+                shift[i] = epsilon
+                finite_difference = (
+                    simulator.quantum_prediction(features, params + shift) -
+                    simulator.quantum_prediction(features, params - shift)
+                ) / (2 * epsilon)
+                self.assertAlmostEqual(gradient[i], finite_difference, places=6)
+            
+            # Batched inputs give one gradient row per sample, also when
+            # the shifted circuits are split into gate blocks and chunks
+            features_batch = rng.standard_normal((5, 10))
+            batch_gradient = simulator.parameter_shift_gradient(features_batch, params)
+            self.assertEqual(batch_gradient.shape, (5, self.model.n_params))
+            
+            simulator.max_batch_amplitudes = 3 * 2 ** simulator.n_qubits
+            np.testing.assert_allclose(
+                simulator.parameter_shift_gradient(features_batch, params), batch_gradient,
+                atol=1e-12
+            )
+    
+    def test_fit(self):
+        """Test mini-batch training loop"""
+        X = np.random.randn(40, 10)
+        y = np.random.uniform(0.4, 0.6, 40)
+        
+        summary = self.model.fit(X, y, batch_size=8, epochs=3, optimizer="adam")
+        
+        # Losses are kept in arrays, not per-sample history
+        self.assertEqual(summary['epochs_run'], 3)
+        self.assertEqual(summary['epoch_loss'].shape, (3,))
+        self.assertEqual(summary['step_loss'].shape, (15,))
+        self.assertEqual(len(self.model.training_history), 0)
+        
+        with self.assertRaises(ValueError):
+            self.model.fit(X, y, optimizer="rmsprop")
+    
+    def test_fit_reduces_loss(self):
+        """Test every optimizer lowers the loss with a non-zero gradient"""
+        simulator = self.model.quantum_circuit
+        rng = np.random.default_rng(0)
+        X = rng.standard_normal((40, 10))
+        initial_params = self.model.circuit_params.copy()
+        
+        with self._mixing_readout(simulator):
+            # Targets from perturbed parameters, so the loss can be reduced
+            teacher_params = initial_params + rng.normal(0, 0.5, initial_params.shape)
+            y = simulator.batch_quantum_prediction(X, teacher_params)
+            
+            for name, learning_rate in (("sgd", 1.0), ("momentum", 0.2), ("adam", 0.05)):
+                self.model.circuit_params = initial_params.copy()
+                summary = self.model.fit(
+                    X, y, batch_size=8, epochs=5,
+                    optimizer=make_optimizer(name, learning_rate)
+                )
+                self.assertLess(summary['epoch_loss'][-1], summary['epoch_loss'][0], name)
+                self.assertFalse(np.allclose(self.model.circuit_params, initial_params), name)
+            
+            # Early stopping when the loss stops improving (overshooting steps)
+            self.model.circuit_params = initial_params.copy()
+            summary = self.model.fit(
+                X, y, batch_size=8, epochs=50, patience=2,
+                optimizer=make_optimizer("adam", 1.0)
+            )
+            self.assertTrue(summary['stopped_early'])
+            self.assertLess(summary['epochs_run'], 50)
+    
+    def test_optimizers(self):
+        """Test optimizers descend a simple quadratic"""
+        for name in OPTIMIZERS:
+            optimizer = make_optimizer(name, 0.05)
+            params = np.ones(4)
+            for _ in range(200):
+                params = optimizer.step(params, 2 * params)
+            self.assertLess(np.linalg.norm(params), 0.5, name)
+    
+    def test_predict_batch(self):
+        """Test batched prediction matches per-sample prediction"""
+        features_batch = [np.random.randn(n) for n in (4, 10, 80)]
+        
+        batch = self.model.predict_batch(features_batch)
+        
+        # Check columnar structure
+        self.assertEqual(batch['prediction'].shape, (3,))
+        
+        for i, features in enumerate(features_batch):
+            pred = self.model.predict(features)
+            self.assertAlmostEqual(batch['prediction'][i], pred['prediction'], places=10)
+            self.assertAlmostEqual(batch['coherence'][i], pred['coherence'], places=10)
+        
+        # List-of-dicts interface is preserved
+        results = self.model.batch_predict(features_batch)
+        self.assertEqual(len(results), 3)
+        self.assertIn('confidence', results[0])
+    
+    def test_score(self):
+        """Test lightweight scoring matches predict()"""
+        features = np.random.randn(10)
+        
+        prediction, quantum_advantage, coherence, confidence = self.model.score(features)
+        result = self.model.predict(features)
+        
+        self.assertEqual(prediction, result['prediction'])
+        self.assertEqual(quantum_advantage, result['quantum_advantage'])
+        self.assertEqual(coherence, result['coherence'])
+        self.assertEqual(confidence, result['confidence'])
+    
+    def test_process_pool_backend(self):
+        """Test sharded process-pool prediction matches in-process results"""
+        features = np.random.randn(50, 10)
+        expected = self.model.predict_batch(features)['prediction']
+        
+        with QuantumProcessPoolBackend(n_workers=2, shard_size=16, seed=3) as backend:
+            self.model.backend = backend
+            predictions = self.model.predict_batch(features)['prediction']
+            sampled = backend.batch_quantum_prediction(
+                self.model.quantum_circuit, features, self.model.circuit_params, shots=64
+            )
+        self.model.backend = None
+        
+        self.assertTrue(np.allclose(predictions, expected))
+        
+        # Shard streams are reproducible from the seed
+        with QuantumProcessPoolBackend(n_workers=1, shard_size=16, seed=3) as backend:
+            backend.calls = 1
+            resampled = backend.batch_quantum_prediction(
+                self.model.quantum_circuit, features, self.model.circuit_params, shots=64
+            )
+        self.assertTrue(np.array_equal(sampled, resampled))
+    
+    def test_checkpoint_round_trip(self):
+        """Test binary checkpoint save and memory-mapped load"""
+        self.model.fit(np.random.randn(8, 10), np.random.rand(8), batch_size=4, epochs=2)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "model.npz")
+            self.model.save(path)
+            
+            loaded = QuantumPredictiveModel.load(path)
+            self.assertTrue(np.array_equal(loaded.circuit_params, self.model.circuit_params))
+            self.assertTrue(np.array_equal(loaded.epoch_losses, self.model.epoch_losses))
+            self.assertEqual(loaded.get_quantum_signature(), self.model.get_quantum_signature())
+            
+            # Read-only mapping still predicts and can be trained further
+            mapped = QuantumPredictiveModel.load(path, mmap_mode="r")
+            self.assertFalse(mapped.circuit_params.flags.writeable)
+            features = np.random.randn(10)
+            self.assertAlmostEqual(
+                mapped.predict(features)['prediction'],
+                self.model.predict(features)['prediction']
+            )
+            mapped.train_step(features, 0.5)
+            del mapped
+            
+            # Truncated parameters or a header that disagrees are rejected
+            with np.load(path) as archive:
+                members = dict(archive)
+            header = json.loads(str(members["header"]))
+            for name, value in [("circuit_params", members["circuit_params"][:-1]),
+                                ("header", np.array(json.dumps(dict(header, n_params=1))))]:
+                broken = os.path.join(tmpdir, f"broken_{name}.npz")
+                with open(broken, 'wb') as f:
+                    np.savez(f, **dict(members, **{name: value}))
+                with self.assertRaises(ValueError):
+                    QuantumPredictiveModel.load(broken)
+    
+    def test_prediction_cache(self):
+        """Test cached predictions, quantization and invalidation"""
+        self.model.prediction_cache = PredictionCache(max_entries=2, ttl_seconds=60)
+        cache = self.model.prediction_cache
+        features = np.random.randn(10)
+        
+        first = self.model.predict(features)
+        second = self.model.predict(features + 1e-9)  # Rounds to the same key
+        self.assertEqual(first, second)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["hit_rate"], 0.5)
+        
+        # Least recently used entry is evicted past max_entries
+        self.model.predict(np.random.randn(10))
+        self.model.predict(np.random.randn(10))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        
+        # Changing parameters invalidates every entry
+        self.model.circuit_params = self.model.circuit_params + 0.1
+        self.model.predict(features)
+        self.assertEqual(cache.stats()["invalidations"], 1)
+        self.assertEqual(len(cache), 1)
+        
+        # Even below the quantum signature's 6-decimal resolution
+        signature = self.model.get_quantum_signature()
+        self.model.circuit_params = self.model.circuit_params + 1e-9
+        self.assertEqual(self.model.get_quantum_signature(), signature)
+        self.model.predict(features)
+        self.assertEqual(cache.stats()["invalidations"], 2)
+        
+        # Expired entries are recomputed
+        cache.ttl_seconds = -1
+        self.model.predict(features)
+        self.assertEqual(cache.stats()["expirations"], 1)
+    
+    def test_single_precision(self):
+        """Test single-precision mode tracks the double-precision path"""
+        single = QuantumPredictiveModel(n_qubits=6, precision="single")
+        single.circuit_params = self.model.circuit_params
+        features = np.random.randn(8, 10)
+        
+        self.assertEqual(
+            single.quantum_circuit.encode_classical_data(features).dtype, np.complex64
+        )
+        
+        single_batch = single.predict_batch(features)
+        double_batch = self.model.predict_batch(features)
+        self.assertTrue(np.allclose(
+            single_batch['prediction'], double_batch['prediction'], atol=1e-5
+        ))
+        
+        report = self.model.precision_report(features, repeats=1)
+        self.assertLess(report['max_abs_error'], 1e-5)
+        self.assertEqual(report['single_bytes_per_state'] * 2, report['double_bytes_per_state'])
+        
+        with self.assertRaises(ValueError):
+            QuantumPredictiveModel(n_qubits=6, precision="half")
+    
+    def test_seeded_model(self):
+        """Test a root seed reproduces initialization and training"""
+        X = np.random.randn(24, 8)
+        y = np.random.rand(24)
+        
+        def train(seed):
+            model = QuantumPredictiveModel(n_qubits=4, learning_rate=0.05, seed=seed)
+            initial = model.circuit_params.copy()
+            history = model.fit(X, y, batch_size=8, epochs=3)
+            return initial, history['step_loss']
+        
+        first, second = train(11), train(11)
+        np.testing.assert_array_equal(first[0], second[0])
+        np.testing.assert_array_equal(first[1], second[1])
+        self.assertFalse(np.array_equal(first[0], train(12)[0]))
+    
     def test_quantum_signature(self):
         """Test quantum signature generation"""
         signature = self.model.get_quantum_signature()
@@ -137,6 +513,41 @@ class TestQuantumOracleFeed(unittest.TestCase):
         self.assertEqual(self.oracle_feed.target_divergence, 0.003)
         self.assertEqual(len(self.oracle_feed.oracle_states), 12)
     
+    def test_seeded_feed(self):
+        """Test seeded feeds draw identical oracles and predictions"""
+        market_data = np.random.randn(40)
+        first = QuantumOracleFeed(n_oracles=6, seed=5)
+        second = QuantumOracleFeed(n_oracles=6, seed=5)
+        
+        self.assertEqual(
+            [o['quantum_phase'] for o in first.oracle_states],
+            [o['quantum_phase'] for o in second.oracle_states]
+        )
+        self.assertEqual(
+            first.quantum_consensus_prediction(market_data)['consensus_prediction'],
+            second.quantum_consensus_prediction(market_data)['consensus_prediction']
+        )
+    
+    def test_oracle_state_vectors(self):
+        """Test dict-style oracle views share the state vectors"""
+        oracle = self.oracle_feed.oracle_states[3]
+        self.assertEqual(oracle['id'], 3)
+        self.assertEqual(oracle['accuracy_score'], 1.0)
+        self.assertIn('last_update', dict(oracle))
+        
+        oracle['accuracy_score'] = 0.5
+        self.assertEqual(self.oracle_feed.accuracy_score[3], 0.5)
+        self.assertEqual(self.oracle_feed.get_oracle_health()[3]['status'], "DEGRADED")
+        with self.assertRaises(KeyError):
+            oracle['predictions']
+        
+        # Every oracle contributes through the vectorized path
+        feed = QuantumOracleFeed(n_oracles=500, seed=1)
+        prediction = feed.quantum_consensus_prediction(np.random.randn(40))
+        self.assertEqual(len(prediction['oracle_predictions']), 500)
+        self.assertAlmostEqual(sum(prediction['oracle_weights']), 1.0)
+        self.assertTrue(all(0.0 <= p <= 1.0 for p in prediction['oracle_predictions']))
+    
     def test_entanglement_matrix(self):
         """Test entanglement matrix generation"""
         matrix = self.oracle_feed.entanglement_matrix
@@ -169,6 +580,130 @@ class TestQuantumOracleFeed(unittest.TestCase):
         # Check cycle time is reasonable
         self.assertLess(prediction['cycle_time_seconds'], 1.0)
     
+    def test_batch_consensus(self):
+        """Test batch consensus matches per-snapshot predictions"""
+        market_matrix = np.random.randn(20, 40)
+        sequential = QuantumOracleFeed(n_oracles=8, seed=2)
+        batched = QuantumOracleFeed(n_oracles=8, seed=2)
+        
+        expected = [sequential.quantum_consensus_prediction(x) for x in market_matrix]
+        batch = batched.batch_consensus(market_matrix)
+        
+        self.assertEqual(batch['oracle_predictions'].shape, (20, 8))
+        np.testing.assert_allclose(
+            batch['consensus_prediction'], [r['consensus_prediction'] for r in expected]
+        )
+        np.testing.assert_allclose(
+            batch['divergence_percent'], [r['divergence_percent'] for r in expected]
+        )
+        self.assertEqual(len(batched.prediction_history), 20)
+        np.testing.assert_allclose(batched.divergence_history, sequential.divergence_history)
+        
+        metrics = batched.get_divergence_metrics()
+        self.assertEqual(metrics['n_predictions'], 20)
+    
+    def test_bounded_history(self):
+        """Test history buffers hold constant memory with rolling metrics"""
+        feed = QuantumOracleFeed(n_oracles=6, seed=1, history_depth=30, metrics_window=20)
+        for _ in range(25):
+            feed.quantum_consensus_prediction(np.random.randn(40))
+        feed.batch_consensus(np.random.randn(40, 40))
+        last = feed.quantum_consensus_prediction(np.random.randn(40))
+        
+        self.assertEqual(len(feed.prediction_history), 30)
+        self.assertEqual(feed.history['oracle_predictions'].data.shape, (30, 6))
+        self.assertEqual(feed.prediction_history[-1], last)
+        
+        recent = feed.divergence_history[-20:]
+        metrics = feed.get_divergence_metrics()
+        self.assertEqual(metrics['n_predictions'], 66)
+        self.assertAlmostEqual(metrics['mean_divergence_percent'], np.mean(recent))
+        self.assertAlmostEqual(metrics['std_divergence_percent'], np.std(recent))
+        self.assertEqual(metrics['min_divergence_percent'], min(recent))
+        self.assertEqual(metrics['max_divergence_percent'], max(recent))
+        self.assertEqual(len(feed.recent_predictions(5)), 5)
+        
+        # Records are reused until the next prediction
+        self.assertIs(feed.prediction_history, feed.prediction_history)
+        feed.quantum_consensus_prediction(np.random.randn(40))
+        self.assertEqual(feed.prediction_history[-2], last)
+        
+        with self.assertRaises(ValueError):
+            QuantumOracleFeed(n_oracles=6, history_depth=0)
+    
+    def test_zero_divergence(self):
+        """Test zero divergence reports infinite achievement instead of raising"""
+        feed = QuantumOracleFeed(n_oracles=6, seed=1)
+        zero = lambda predictions, consensus: np.zeros(np.shape(consensus))
+        with mock.patch.object(feed, '_calculate_divergence', zero):
+            single = feed.quantum_consensus_prediction(np.random.randn(40))
+            batch = feed.batch_consensus(np.random.randn(3, 40))
+        
+        self.assertEqual(single['divergence_achievement'], np.inf)
+        self.assertTrue(np.all(np.isinf(batch['divergence_achievement'])))
+        self.assertEqual(feed.get_divergence_metrics()['achievement_percent'], np.inf)
+        self.assertTrue(all(
+            record['divergence_achievement'] == np.inf for record in feed.prediction_history
+        ))
+    
+    def test_streaming_correlation(self):
+        """Test streaming correlation against a direct computation"""
+        samples = np.random.randn(60, 5) @ np.random.randn(5, 5) + 0.8
+        sequential = StreamingCorrelation(5, span=10)
+        batched = StreamingCorrelation(5, span=10)
+        for x in samples:
+            sequential.update(x)
+        batched.update_batch(samples[:25])
+        batched.update_batch(samples[25:])
+        
+        alpha = 2 / 11
+        weights = (1 - alpha) ** np.arange(59, -1, -1)
+        weights /= weights.sum()
+        centered = samples - weights @ samples
+        covariance = (centered.T * weights) @ centered
+        expected = covariance / np.sqrt(np.outer(np.diag(covariance), np.diag(covariance)))
+        
+        np.testing.assert_allclose(sequential.correlation(), expected, atol=1e-10)
+        np.testing.assert_allclose(batched.correlation(), expected, atol=1e-10)
+        
+        # Entanglement adapts every cycle once a span of predictions is seen
+        for cycle in range(12):
+            self.oracle_feed.quantum_consensus_prediction(np.random.randn(40))
+            before = self.oracle_feed.entanglement_matrix.copy()
+            self.oracle_feed.optimize_entanglement()
+        self.assertFalse(np.allclose(before, self.oracle_feed.entanglement_matrix))
+        np.testing.assert_allclose(self.oracle_feed.entanglement_matrix.max(axis=1), 1.0)
+    
+    def test_banded_entanglement(self):
+        """Test banded entanglement against the dense path"""
+        comparison = compare_entanglement_paths(400, cutoff=1e-6, length=5)
+        self.assertTrue(comparison['feed_uses_band'])
+        self.assertLess(comparison['density'], 0.5)
+        self.assertLessEqual(comparison['max_abs_error'], comparison['error_bound'])
+        self.assertLess(comparison['consensus_max_abs_error'], 1e-5)
+        
+        # Sparse and numpy kernels agree with the dense product
+        banded = BandedMatrix.distance_decay(60, length=4, cutoff=1e-4)
+        vectors = np.random.rand(5, 60)
+        expected = vectors @ banded.to_dense().T
+        np.testing.assert_allclose(banded.apply(vectors), expected)
+        with mock.patch('oracle_feed_quantum.sparse', None):
+            np.testing.assert_allclose(banded.apply(vectors), expected)
+            np.testing.assert_allclose(banded.apply(vectors[0]), expected[0])
+        
+        # Banded feeds learn within the band; wide bands stay dense
+        feed = QuantumOracleFeed(n_oracles=200, seed=3, entanglement_cutoff=1e-4,
+                                 entanglement_length=5)
+        self.assertIsInstance(feed.entanglement_matrix, BandedMatrix)
+        feed.batch_consensus(np.random.randn(12, 40))
+        feed.optimize_entanglement()
+        np.testing.assert_allclose(feed.dense_entanglement_matrix().max(axis=1), 1.0)
+        
+        dense = QuantumOracleFeed(n_oracles=24, entanglement_cutoff=1e-3)
+        self.assertIsInstance(dense.entanglement_matrix, np.ndarray)
+        with self.assertRaises(ValueError):
+            QuantumOracleFeed(n_oracles=24, entanglement_cutoff=2.0)
+    
     def test_oracle_update(self):
         """Test oracle accuracy update"""
         market_data = np.random.randn(40)
@@ -254,6 +789,227 @@ class TestQuantumSubNodes(unittest.TestCase):
         successful = sum(1 for r in results if r['status'] == 'SUCCESS')
         self.assertGreater(successful, 15)  # At least 75% success
     
+    def test_batch_engine(self):
+        """Test vectorized batch assignment matches sequential distribution"""
+        # Mixed loads, a degraded node and enough tasks to saturate the cluster
+        for i, node in enumerate(self.cluster.nodes):
+            node.load = (i % 5) * 0.2
+        self.cluster.nodes[3].status = "DEGRADED"
+        sequential = copy.deepcopy(self.cluster)
+        
+        tasks = np.random.randn(200, 10)
+        batch = self.cluster.distribute_batch(tasks)
+        expected = [sequential.distribute_task(task)['node_id'] for task in tasks]
+        
+        # Check columnar structure and identical load balancing
+        self.assertEqual(batch['result'].shape, (200,))
+        self.assertEqual(list(batch['node_id']), expected)
+        for node, reference in zip(self.cluster.nodes, sequential.nodes):
+            self.assertEqual(node.load, reference.load)
+            self.assertEqual(node.tasks_completed, reference.tasks_completed)
+        
+        self.assertEqual(self.cluster.cluster_metrics['total_tasks'], 200)
+        self.assertTrue(np.all((batch['result'] >= 0) & (batch['result'] <= 1)))
+    
+    def test_concurrent_workers(self):
+        """Test worker-backed execution accounts load from queue occupancy"""
+        self.cluster.start_workers(queue_depth=4, task_timeout=5.0)
+        try:
+            results = self.cluster.batch_process([np.random.randn(10) for _ in range(50)])
+            self.assertTrue(all(r['status'] == 'SUCCESS' for r in results))
+            self.assertIn('queue_time', results[0])
+        finally:
+            self.cluster.stop_workers()
+        
+        # Queues are drained, so no load is left behind
+        self.assertTrue(all(node.load == 0.0 for node in self.cluster.nodes))
+        self.assertEqual(self.cluster.cluster_metrics['successful_tasks'], 50)
+    
+    def _stall(self, nodes, release):
+        """Make process_task on the given nodes wait for release"""
+        stalled = set(map(id, nodes))
+        process_task = QuantumSubNode.process_task
+        
+        def stalling_process_task(node, task_data):
+            if id(node) in stalled:
+                release.wait()
+            return process_task(node, task_data)
+        
+        patcher = mock.patch.object(QuantumSubNode, 'process_task', stalling_process_task)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _fail(self, nodes):
+        """Make tasks on the given nodes fail inside process_task"""
+        failing = set(map(id, nodes))
+        encode_task = QuantumSubNode._encode_task
+        
+        def failing_encode_task(node, task_data):
+            if id(node) in failing:
+                raise RuntimeError("Injected failure")
+            return encode_task(node, task_data)
+        
+        patcher = mock.patch.object(QuantumSubNode, '_encode_task', failing_encode_task)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_worker_failure_failover(self):
+        """Test a failing node fails over to its backup in worker mode"""
+        failing = self.cluster.nodes[0]
+        self._fail([failing])
+        
+        self.cluster.start_workers(queue_depth=4, task_timeout=5.0)
+        try:
+            result = self.cluster.distribute_task(np.random.randn(10))
+        finally:
+            self.cluster.stop_workers()
+        
+        self.assertEqual(result['status'], 'SUCCESS')
+        self.assertTrue(result['failover'])
+        self.assertEqual(result['failed_node'], failing.node_id)
+        self.assertEqual(result['node_id'], failing.backup_nodes[0])
+        self.assertEqual(failing.tasks_failed, 1)
+        self.assertEqual(self.cluster.cluster_metrics['failovers'], 1)
+        self.assertEqual(self.cluster.cluster_metrics['successful_tasks'], 1)
+    
+    def test_timeout_failover(self):
+        """Test a stalled node fails over to its backup on timeout"""
+        release = threading.Event()
+        stalled = self.cluster.nodes[0]
+        self._stall([stalled], release)
+        
+        self.cluster.start_workers(queue_depth=4, task_timeout=0.1)
+        try:
+            result = self.cluster.distribute_task(np.random.randn(10))
+        finally:
+            release.set()
+            self.cluster.stop_workers()
+        
+        self.assertEqual(result['status'], 'SUCCESS')
+        self.assertTrue(result['failover'])
+        self.assertEqual(result['node_id'], stalled.backup_nodes[0])
+        self.assertEqual(self.cluster.cluster_metrics['timeouts'], 1)
+    
+    def test_backpressure(self):
+        """Test submission blocks and rejects when every node is saturated"""
+        cluster = QuantumSubNodeCluster(n_nodes=2, qubits_per_node=2)
+        release = threading.Event()
+        self._stall(cluster.nodes, release)
+        
+        cluster.start_workers(queue_depth=2, backpressure_timeout=0.05)
+        try:
+            # Two tasks per node reach load 1.0 on both nodes
+            for _ in range(4):
+                cluster.submit_task(np.random.randn(4))
+            with self.assertRaises(TimeoutError):
+                cluster.submit_task(np.random.randn(4))
+            
+            # A rejected distribute_task counts as a failed task, async or not
+            result = cluster.distribute_task(np.random.randn(4))
+            async_result = asyncio.run(cluster.distribute_task_async(np.random.randn(4)))
+        finally:
+            release.set()
+            cluster.close()
+        
+        self.assertEqual(result['status'], 'FAILED')
+        self.assertEqual(async_result['status'], 'FAILED')
+        self.assertEqual(cluster.cluster_metrics['rejected_tasks'], 3)
+        self.assertEqual(cluster.cluster_metrics['total_tasks'], 2)
+        self.assertEqual(cluster.cluster_metrics['failed_tasks'], 2)
+    
+    def test_sampled_submission_fallback(self):
+        """Test a sampled pair of busy nodes falls back to an open node"""
+        cluster = QuantumSubNodeCluster(
+            n_nodes=8, qubits_per_node=2, scheduler="power_of_two", seed=1
+        )
+        for node in cluster.nodes[:6]:
+            node.status = "DEGRADED"
+        
+        cluster.start_workers(queue_depth=4, task_timeout=5.0, backpressure_timeout=0.5)
+        try:
+            results = [cluster.distribute_task(np.random.randn(4)) for _ in range(20)]
+        finally:
+            cluster.close()
+        
+        self.assertTrue(all(r['status'] == 'SUCCESS' for r in results))
+        self.assertTrue(all(r['node_id'] in (6, 7) for r in results))
+        self.assertEqual(cluster.cluster_metrics['rejected_tasks'], 0)
+    
+    def test_async_distribution(self):
+        """Test asyncio front-end results and deadlines"""
+        tasks = [np.random.randn(10) for _ in range(20)]
+        
+        async def run_sequential():
+            single = await self.cluster.distribute_task_async(tasks[0])
+            batch = await self.cluster.batch_process_async(tasks, timeout=5.0)
+            return single, batch
+        
+        try:
+            single, batch = asyncio.run(run_sequential())
+            self.assertEqual(single['status'], 'SUCCESS')
+            self.assertEqual(len(batch), 20)
+            self.assertTrue(all(r['status'] == 'SUCCESS' for r in batch))
+            
+            # A stalled cluster misses the deadline instead of blocking
+            release = threading.Event()
+            self._stall(self.cluster.nodes, release)
+            self.cluster.start_workers(queue_depth=4, task_timeout=5.0)
+            
+            result = asyncio.run(self.cluster.distribute_task_async(tasks[0], timeout=0.05))
+            release.set()
+        finally:
+            self.cluster.close()
+        
+        self.assertEqual(result['status'], 'FAILED')
+        self.assertEqual(self.cluster.cluster_metrics['deadline_misses'], 1)
+    
+    def test_async_failure_failover(self):
+        """Test a failing node fails over to its backup through asyncio"""
+        failing = self.cluster.nodes[0]
+        self._fail([failing])
+        
+        self.cluster.start_workers(queue_depth=4, task_timeout=5.0)
+        try:
+            result = asyncio.run(self.cluster.distribute_task_async(np.random.randn(10)))
+        finally:
+            self.cluster.close()
+        
+        self.assertEqual(result['status'], 'SUCCESS')
+        self.assertTrue(result['failover'])
+        self.assertEqual(result['node_id'], failing.backup_nodes[0])
+        self.assertEqual(self.cluster.cluster_metrics['failovers'], 1)
+        self.assertEqual(self.cluster.cluster_metrics['successful_tasks'], 1)
+    
+    def test_async_deadline_counted_once(self):
+        """Test a sequential task finishing after its deadline is only a deadline miss"""
+        release = threading.Event()
+        self._stall(self.cluster.nodes, release)
+        
+        async def run():
+            single = await self.cluster.distribute_task_async(np.random.randn(10), timeout=0.05)
+            release.set()
+            batch = await self.cluster.batch_process_async(
+                [np.random.randn(10) for _ in range(5)], timeout=5.0
+            )
+            return single, batch
+        
+        try:
+            single, batch = asyncio.run(run())
+            # Let the late job finish on the executor thread
+            self.cluster._get_async_executor().submit(lambda: None).result()
+        finally:
+            self.cluster.close()
+        
+        self.assertEqual(single['status'], 'FAILED')
+        self.assertTrue(all(r['status'] == 'SUCCESS' for r in batch))
+        metrics = self.cluster.cluster_metrics
+        self.assertEqual(metrics['deadline_misses'], 1)
+        self.assertEqual(metrics['total_tasks'], 5)
+        self.assertEqual(metrics['successful_tasks'], 5)
+        # The node still did the late work
+        completed = sum(node.tasks_completed for node in self.cluster.nodes)
+        self.assertEqual(completed, 6)
+    
     def test_cluster_health(self):
         """Test cluster health metrics"""
         health = self.cluster.get_cluster_health()
@@ -267,6 +1023,212 @@ class TestQuantumSubNodes(unittest.TestCase):
         # Should be healthy initially
         self.assertEqual(health['cluster_status'], 'HEALTHY')
     
+    def test_concurrent_counters(self):
+        """Test running task totals stay exact under concurrent workers"""
+        cluster = QuantumSubNodeCluster(n_nodes=24, qubits_per_node=4)
+        self._fail(cluster.nodes[:2])
+        
+        # Switch threads often so unguarded updates would interleave
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+        
+        def submit_many():
+            for _ in range(300):
+                cluster.distribute_task(np.random.randn(10))
+        
+        cluster.start_workers(queue_depth=64, task_timeout=30.0)
+        try:
+            cluster.batch_process(np.random.randn(4000, 10))
+            
+            # Several callers record cluster metrics at once
+            callers = [threading.Thread(target=submit_many) for _ in range(4)]
+            for caller in callers:
+                caller.start()
+            for caller in callers:
+                caller.join()
+        finally:
+            cluster.close()
+        
+        store = cluster.store
+        self.assertEqual(store.completed_sum, int(np.sum(store.tasks_completed)))
+        self.assertEqual(store.failed_sum, int(np.sum(store.tasks_failed)))
+        self.assertGreater(store.failed_sum, 0)
+        
+        metrics = cluster.cluster_metrics
+        self.assertEqual(metrics['total_tasks'], 5200)
+        self.assertEqual(metrics['successful_tasks'] + metrics['failed_tasks'], 5200)
+        self.assertEqual(metrics['failovers'], store.failed_sum)
+        
+        health = cluster.get_cluster_health()
+        self.assertEqual(health['total_tasks_completed'], metrics['successful_tasks'])
+    
+    def test_health_snapshot(self):
+        """Test health reads are side-effect free and match node counters"""
+        self.cluster.batch_process([np.random.randn(10) for _ in range(30)])
+        self.cluster.nodes[5].status = "DEGRADED"
+        self.cluster.nodes[6].tasks_failed += 2
+        loads = [node.load for node in self.cluster.nodes]
+        
+        health = self.cluster.get_cluster_health()
+        details = self.cluster.get_node_details()
+        self.cluster.redundancy_proof_check()
+        
+        # Polling leaves scheduling state untouched
+        self.assertEqual([node.load for node in self.cluster.nodes], loads)
+        
+        # Running aggregates agree with the per-node values
+        self.assertEqual(health['operational_nodes'], 11)
+        self.assertAlmostEqual(health['average_load'], np.mean(loads))
+        self.assertEqual(health['total_tasks_completed'], 30)
+        self.assertEqual(health['total_tasks_failed'], 2)
+        self.assertEqual(details[5]['status'], 'DEGRADED')
+        self.assertEqual(details[6]['tasks_failed'], 2)
+        json.dumps(self.cluster.export_cluster_state())
+    
+    def test_cluster_heartbeat(self):
+        """Test vectorized heartbeat matches per-node heartbeats"""
+        self.cluster.batch_process([np.random.randn(10) for _ in range(40)])
+        reference = copy.deepcopy(self.cluster)
+        
+        self.cluster.heartbeat()
+        for node in reference.nodes:
+            node.heartbeat()
+        
+        self.assertEqual(
+            [node.load for node in self.cluster.nodes],
+            [node.load for node in reference.nodes]
+        )
+        self.assertEqual(
+            self.cluster.scheduler.select(), reference.scheduler.select()
+        )
+    
+    def test_compact_nodes(self):
+        """Test nodes are slotted views over the cluster store"""
+        node = self.cluster.nodes[5]
+        self.assertFalse(hasattr(node, '__dict__'))
+        self.assertTrue(np.shares_memory(node.quantum_state, self.cluster.store.state))
+        self.assertAlmostEqual(np.linalg.norm(node.quantum_state), 1.0, places=6)
+        
+        node.load = 0.4
+        self.assertEqual(self.cluster.store.load[5], 0.4)
+        
+        estimate = QuantumSubNodeCluster.estimate_memory(24, 6)
+        self.assertGreater(estimate, self.cluster.store.nbytes)
+        with self.assertRaises(ValueError):
+            QuantumSubNodeCluster(n_nodes=24, qubits_per_node=6, memory_budget=estimate - 1)
+    
+    def test_shared_store(self):
+        """Test an attached store maps the cluster arrays without copying"""
+        cluster = QuantumSubNodeCluster(n_nodes=8, qubits_per_node=3, shared=True)
+        self.addCleanup(cluster.close)
+        cluster.distribute_task(np.random.randn(8))
+        
+        attached = SubNodeStore.attach(cluster.store.spec())
+        try:
+            np.testing.assert_array_equal(attached.state, cluster.store.state)
+            self.assertEqual(attached.completed_sum, 1)
+            self.assertEqual(attached.operational_count, 8)
+            
+            attached.capacity[3] = 0.5
+            self.assertEqual(cluster.nodes[3].processing_capacity, 0.5)
+        finally:
+            attached.close()
+        
+        with self.assertRaises(ValueError):
+            self.cluster.store.spec()
+    
+    def test_seeded_cluster(self):
+        """Test seeded clusters replay states, placements and noise"""
+        tasks = [np.random.randn(10) for _ in range(30)]
+        
+        def run(seed):
+            cluster = QuantumSubNodeCluster(n_nodes=6, qubits_per_node=3,
+                                            scheduler="power_of_two", seed=seed)
+            batch = cluster.distribute_batch(tasks)
+            single = cluster.distribute_task(tasks[0])
+            return cluster, batch, single
+        
+        first, second = run(3), run(3)
+        np.testing.assert_array_equal(first[0].state_matrix, second[0].state_matrix)
+        np.testing.assert_array_equal(first[1]['node_id'], second[1]['node_id'])
+        np.testing.assert_array_equal(first[1]['result'], second[1]['result'])
+        self.assertEqual(first[2]['result'], second[2]['result'])
+        
+        # Each node draws from its own child of the cluster seed
+        node = first[0].nodes[4]
+        expected = np.random.default_rng(first[0].node_seed.spawn(5)[4]).standard_normal(3)
+        np.testing.assert_array_equal(
+            QuantumSubNode.from_store(node._store, 4, seed_root=first[0].node_seed)
+            .rng.standard_normal(3),
+            expected
+        )
+        
+        self.assertFalse(np.array_equal(first[0].state_matrix, run(4)[0].state_matrix))
+    
+    def test_elastic_membership(self):
+        """Test adding, draining and removing nodes keeps redundancy valid"""
+        new_ids = self.cluster.add_nodes(3)
+        self.assertEqual(new_ids, [12, 13, 14])
+        self.assertEqual(self.cluster.n_nodes, 15)
+        self.assertEqual(self.cluster.nodes[13].backup_nodes, ((13 + 5) % 15, (13 + 10) % 15))
+        
+        # Backups are assign-only: writes go through the setter to the store
+        with self.assertRaises(AttributeError):
+            self.cluster.nodes[13].backup_nodes.append(0)
+        with self.assertRaises(ValueError):
+            self.cluster.nodes[13].backup_nodes = [0, 1, 2]
+        
+        self.cluster.drain_node(5)
+        removal = self.cluster.remove_nodes([5, 10, 14])
+        self.assertEqual(removal['n_nodes'], 12)
+        self.assertEqual(self.cluster.nodes[10].status, 'REMOVED')
+        self.assertEqual(len(self.cluster.get_node_details()), 12)
+        
+        redundancy = self.cluster.redundancy_proof_check()
+        self.assertEqual(redundancy['redundancy_proof_status'], 'VERIFIED')
+        members = {node['node_id'] for node in self.cluster.get_node_details()}
+        for node in self.cluster.get_node_details():
+            self.assertTrue(set(node['backup_nodes']) <= members - {node['node_id']})
+        
+        # Removed nodes take no tasks, sequential or batched
+        batch = self.cluster.batch_process([np.random.randn(10) for _ in range(200)])
+        used = {result['node_id'] for result in batch}
+        used.add(self.cluster.distribute_task(np.random.randn(10))['node_id'])
+        self.assertFalse(used & {5, 10, 14})
+        
+        with self.assertRaises(ValueError):
+            self.cluster.remove_nodes([10])
+        small = QuantumSubNodeCluster(n_nodes=4, qubits_per_node=2)
+        with self.assertRaises(ValueError):
+            small.remove_nodes([0, 1])
+    
+    def test_drain_migrates_queued_tasks(self):
+        """Test draining a stalled worker moves its queue to other nodes"""
+        release = threading.Event()
+        stalled = self.cluster.nodes[0]
+        self._stall([stalled], release)
+        
+        self.cluster.start_workers(queue_depth=8, task_timeout=5.0)
+        try:
+            futures = [
+                self.cluster.submit_task(np.random.randn(10), node_index=0)[1]
+                for _ in range(4)
+            ]
+            drained = self.cluster.drain_node(0)
+            self.assertGreaterEqual(drained['migrated_tasks'], 3)
+            
+            # Migrated tasks complete while node 0 is still stalled
+            migrated = [future.result(timeout=5.0) for future in futures[1:]]
+            self.assertTrue(all(result['node_id'] != 0 for result in migrated))
+            
+            release.set()
+            self.cluster.remove_nodes([0])
+            self.assertEqual(futures[0].result(timeout=5.0)['status'], 'SUCCESS')
+            self.assertEqual(len(self.cluster.workers), 11)
+        finally:
+            release.set()
+            self.cluster.stop_workers()
+    
     def test_redundancy_proof(self):
         """Test redundancy proofing"""
         redundancy = self.cluster.redundancy_proof_check()
@@ -279,6 +1241,121 @@ class TestQuantumSubNodes(unittest.TestCase):
         self.assertEqual(redundancy['redundancy_proof_status'], 'VERIFIED')
 
 
+class TestQuantumScheduler(unittest.TestCase):
+    """Test sub-node scheduling policies"""
+    
+    def setUp(self):
+        self.cluster = QuantumSubNodeCluster(n_nodes=16, qubits_per_node=2)
+    
+    def test_indexed_heap(self):
+        """Test heap selection and key updates"""
+        keys = [(k,) for k in np.random.rand(50)]
+        heap = IndexedMinHeap(keys)
+        self.assertEqual(heap.peek(), int(np.argmin(keys)))
+        
+        for _ in range(200):
+            item = np.random.randint(50)
+            keys[item] = (np.random.rand(),)
+            heap.update(item, keys[item])
+            self.assertEqual(heap.peek(), int(np.argmin(keys)))
+        
+        item = heap.push((-1.0,))
+        self.assertEqual(heap.peek(), item)
+    
+    def test_least_loaded_matches_scan(self):
+        """Test heap selection tracks load and status changes"""
+        for step in range(300):
+            if step % 7 == 0:
+                self.cluster.nodes[step % 16].heartbeat()
+            if step % 50 == 0:
+                self.cluster.nodes[step % 16].status = "DEGRADED"
+            
+            available = [
+                n for n in self.cluster.nodes
+                if n.status == "OPERATIONAL" and n.load < 0.9
+            ]
+            if available:
+                expected = min(available, key=lambda n: n.load / n.processing_capacity)
+            else:
+                expected = min(self.cluster.nodes, key=lambda n: n.load)
+            
+            result = self.cluster.distribute_task(np.random.randn(4))
+            self.assertEqual(result['node_id'], expected.node_id)
+    
+    def test_policies(self):
+        """Test alternative policies place every task"""
+        for policy in ("power_of_two", "weighted_round_robin"):
+            self.cluster.set_scheduler(policy)
+            for node in self.cluster.nodes:
+                node.load = 0.0
+            
+            batch = self.cluster.distribute_batch(np.random.randn(64, 4))
+            self.assertEqual(len(batch['node_id']), 64)
+            self.assertEqual(self.cluster.scheduler.policy, policy)
+        
+        # Weighted round-robin follows capacity shares while nodes are free
+        self.cluster.set_scheduler("weighted_round_robin")
+        for node in self.cluster.nodes:
+            node.load = 0.0
+        counts = np.bincount(self.cluster.scheduler.assign(64, task_load=0.0), minlength=16)
+        self.assertLessEqual(counts.max() - counts.min(), 1)
+        
+        with self.assertRaises(ValueError):
+            make_scheduler("random", self.cluster.nodes)
+
+
+class TestClusterBenchmark(unittest.TestCase):
+    """Test cluster benchmark harness"""
+    
+    def setUp(self):
+        self.report = run_benchmark(
+            node_counts=[8], qubit_counts=[2], batch_sizes=[16],
+            failure_rates=[0.0, 0.5], n_tasks=60, repeats=2, seed=3
+        )
+    
+    def test_run_benchmark(self):
+        """Test sweep results and injected failures"""
+        self.assertEqual(self.report['format_version'], BENCHMARK_FORMAT_VERSION)
+        keys = [result['key'] for result in self.report['results']]
+        self.assertEqual(keys, [
+            "batch:nodes=8,qubits=2,batch=16",
+            "task:nodes=8,qubits=2,failure_rate=0.0",
+            "task:nodes=8,qubits=2,failure_rate=0.5"
+        ])
+        
+        for result in self.report['results']:
+            self.assertGreater(result['tasks_per_sec'], 0)
+            self.assertLessEqual(result['latency_p50_us'], result['latency_p99_us'])
+        
+        clean, faulty = self.report['results'][1:]
+        self.assertEqual(clean['failover_rate'], 0.0)
+        self.assertGreater(faulty['failover_rate'], 0.0)
+        self.assertGreater(faulty['failure_rate_observed'], 0.0)
+        
+        # Fault injection is removed afterwards and the report is JSON
+        json.dumps(self.report)
+    
+    def test_compare_to_baseline(self):
+        """Test regression and improvement detection"""
+        comparison = compare_to_baseline(self.report, self.report)
+        self.assertTrue(comparison['passed'])
+        self.assertEqual(comparison['compared'], 3)
+        
+        current = copy.deepcopy(self.report)
+        current['results'][0]['tasks_per_sec'] *= 0.5
+        current['results'][1]['latency_p50_us'] *= 0.5
+        current['results'].append({'key': "batch:nodes=99,qubits=2,batch=16"})
+        comparison = compare_to_baseline(current, self.report)
+        
+        self.assertFalse(comparison['passed'])
+        self.assertEqual([r['metric'] for r in comparison['regressions']], ['tasks_per_sec'])
+        self.assertIn('latency_p50_us', [r['metric'] for r in comparison['improvements']])
+        self.assertEqual(comparison['missing'], ["batch:nodes=99,qubits=2,batch=16"])
+        
+        with self.assertRaises(ValueError):
+            compare_to_baseline(self.report, {'format_version': 0, 'results': []})
+
+
 class TestFAAActuaryQuantumCore(unittest.TestCase):
     """Test FAA Actuary Quantum Core integration"""
     
@@ -332,6 +1409,18 @@ class TestFAAActuaryQuantumCore(unittest.TestCase):
         self.assertIn('quantum', metrics)
         self.assertIn('oracle', metrics)
     
+    def test_prediction_cache_metrics(self):
+        """Test repeated revenue predictions are served from the cache"""
+        market_features = np.random.randn(40)
+        
+        first = self.core.quantum_revenue_prediction(market_features)
+        second = self.core.quantum_revenue_prediction(market_features)
+        self.assertEqual(first['predicted_revenue'], second['predicted_revenue'])
+        
+        cache_stats = self.core.get_hotstack_dashboard_metrics()['quantum']['prediction_cache']
+        self.assertEqual(cache_stats['hits'], 1)
+        self.assertEqual(cache_stats['misses'], 1)
+    
     def test_phase_38_status(self):
         """Test Phase 38 status report"""
         status = self.core.get_phase_38_status()
@@ -356,6 +1445,8 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestQuantumPredictiveModel))
     suite.addTests(loader.loadTestsFromTestCase(TestQuantumOracleFeed))
     suite.addTests(loader.loadTestsFromTestCase(TestQuantumSubNodes))
+    suite.addTests(loader.loadTestsFromTestCase(TestQuantumScheduler))
+    suite.addTests(loader.loadTestsFromTestCase(TestClusterBenchmark))
     suite.addTests(loader.loadTestsFromTestCase(TestFAAActuaryQuantumCore))
     
     # Run tests